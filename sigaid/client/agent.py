@@ -19,7 +19,7 @@ from sigaid.lease.manager import LeaseManager
 from sigaid.models.agent import AgentInfo
 from sigaid.models.lease import Lease
 from sigaid.models.proof import ProofBundle, ProofBundleBuilder
-from sigaid.models.state import ActionType, StateEntry
+from sigaid.models.state import ActionType, StateEntry, coerce_action_type
 from sigaid.state.chain import StateChain
 
 if TYPE_CHECKING:
@@ -435,7 +435,7 @@ class AgentClient:
         # Convert string to ActionType
         if isinstance(action_type, str):
             try:
-                action_type = ActionType(action_type)
+                action_type = coerce_action_type(action_type)
             except ValueError:
                 action_type = ActionType.CUSTOM
         
@@ -5,6 +5,8 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
 from sigaid.client.http import HTTPClient
 from sigaid.constants import DEFAULT_AUTHORITY_URL
 from sigaid.exceptions import AgentNotFound, AgentRevoked, AuthorityError
@@ -43,6 +45,7 @@ class AuthorityClient:
         api_key: str | None = None,
         *,
         timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """
         Initialize Authority client.
@@ -51,8 +54,9 @@ class AuthorityClient:
             base_url: Authority service URL
             api_key: API key for authentication
             timeout: Request timeout
+            transport: Optional httpx transport (see HTTPClient)
         """
-        self._http = HTTPClient(base_url, api_key, timeout=timeout)
+        self._http = HTTPClient(base_url, api_key, timeout=timeout, transport=transport)
     
     # ========== Agent Operations ==========
     
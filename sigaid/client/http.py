@@ -30,6 +30,7 @@ class HTTPClient:
         *,
         timeout: float = 30.0,
         max_retries: int = 3,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """
         Initialize HTTP client.
@@ -39,11 +40,14 @@ class HTTPClient:
             api_key: API key for authentication
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            transport: Optional httpx transport, e.g. httpx.ASGITransport to
+                call an in-process Authority app without going through sockets
         """
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._timeout = timeout
         self._max_retries = max_retries
+        self._transport = transport
         
         self._client: httpx.AsyncClient | None = None
     
@@ -58,6 +62,7 @@ class HTTPClient:
                 base_url=self._base_url,
                 headers=headers,
                 timeout=self._timeout,
+                transport=self._transport,
             )
         return self._client
     
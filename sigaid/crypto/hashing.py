@@ -13,16 +13,26 @@ if TYPE_CHECKING:
     from sigaid.models.state import StateEntry
 
 
+# Inputs at least this large are hashed on multiple threads; below it the
+# thread handoff costs more than it saves
+_MULTITHREAD_THRESHOLD = 1 << 20
+
+
 def hash_bytes(data: bytes) -> bytes:
     """
     BLAKE3 hash, returns 32 bytes.
     
+    Large inputs (e.g. big action data payloads) are hashed with BLAKE3's
+    multithreaded mode; the digest is the same either way.
+    
     Args:
         data: Data to hash
         
     Returns:
         32-byte hash digest
     """
+    if len(data) >= _MULTITHREAD_THRESHOLD:
+        return blake3.blake3(data, max_threads=blake3.blake3.AUTO).digest()
     return blake3.blake3(data).digest()
 
 
@@ -59,6 +69,32 @@ def hash_multiple(*items: bytes) -> bytes:
     return hasher.digest()
 
 
+# Length prefix hash_multiple() writes before a 32-byte item
+_HASH_SIZE_PREFIX = BLAKE3_HASH_SIZE.to_bytes(4, "big")
+
+
+def hash_pair(left: bytes, right: bytes) -> bytes:
+    """
+    Hash two items, equivalent to hash_multiple(left, right).
+    
+    For the common case of two 32-byte digests (Merkle nodes), the
+    length-prefixed input is built in one join and hashed in a single
+    update instead of four.
+    
+    Args:
+        left: First byte string
+        right: Second byte string
+        
+    Returns:
+        32-byte hash digest
+    """
+    if len(left) == BLAKE3_HASH_SIZE and len(right) == BLAKE3_HASH_SIZE:
+        return blake3.blake3(
+            b"".join((_HASH_SIZE_PREFIX, left, _HASH_SIZE_PREFIX, right))
+        ).digest()
+    return hash_multiple(left, right)
+
+
 def hash_state_entry_fields(
     agent_id: str,
     sequence: int,
@@ -111,15 +147,10 @@ def hash_state_entry(entry: StateEntry) -> bytes:
     Returns:
         32-byte entry hash
     """
-    # Hash all fields including signature
-    hasher = blake3.blake3()
-    hasher.update(entry.agent_id.encode("utf-8"))
-    hasher.update(struct.pack(">Q", entry.sequence))
-    hasher.update(entry.prev_hash)
-    hasher.update(entry.timestamp.isoformat().encode("utf-8"))
-    hasher.update(entry.action_type.value.encode("utf-8"))
-    hasher.update(entry.action_summary.encode("utf-8"))
-    hasher.update(entry.action_data_hash)
+    # Hash all fields including signature. signable_bytes() is the other
+    # fields in canonical order and is memoized on the entry, so chain
+    # verification serializes each entry once for both hash and signature.
+    hasher = blake3.blake3(entry.signable_bytes())
     hasher.update(entry.signature)
     
     return hasher.digest()
@@ -143,25 +174,25 @@ def verify_chain_integrity(entries: Sequence[StateEntry]) -> bool:
     if not entries:
         return True
     
-    for i, entry in enumerate(entries):
-        # Check prev_hash linkage
-        if i == 0:
-            # First entry in this segment - prev_hash links to previous segment
-            # or is zero hash for genesis
-            pass
-        else:
-            expected_prev = hash_state_entry(entries[i - 1])
-            if entry.prev_hash != expected_prev:
-                return False
-        
+    prev_entry = None
+    for entry in entries:
         # Verify entry_hash
-        computed_hash = hash_state_entry(entry)
-        if entry.entry_hash != computed_hash:
+        if entry.entry_hash != hash_state_entry(entry):
             return False
         
-        # Verify sequence is monotonically increasing
-        if i > 0 and entry.sequence != entries[i - 1].sequence + 1:
-            return False
+        # Check prev_hash linkage. The first entry in this segment links to a
+        # previous segment or is the zero hash for genesis. Later entries link
+        # to the previous entry's stored hash, which the previous iteration
+        # already checked, so it is not recomputed here.
+        if prev_entry is not None:
+            if entry.prev_hash != prev_entry.entry_hash:
+                return False
+            
+            # Verify sequence is monotonically increasing
+            if entry.sequence != prev_entry.sequence + 1:
+                return False
+        
+        prev_entry = entry
     
     return True
 
@@ -32,6 +32,7 @@ __all__ = [
     "SoftwareKeyProvider",
     "get_key_provider",
     "set_key_provider",
+    "reset_key_provider",
 ]
 
 # Global key provider instance
@@ -65,3 +66,13 @@ def set_key_provider(provider: KeyProvider) -> None:
     """
     global _key_provider
     _key_provider = provider
+
+
+def reset_key_provider() -> None:
+    """Reset the global key provider.
+
+    The next call to get_key_provider() creates a fresh default
+    SoftwareKeyProvider. Intended for tests that need isolated key state.
+    """
+    global _key_provider
+    _key_provider = None
@@ -12,6 +12,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from ..signing import domain_prefix
+
 
 class KeyType(str, Enum):
     """Supported key types."""
@@ -26,7 +28,7 @@ class KeyUsage(str, Enum):
     KEY_AGREEMENT = "key_agreement"
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyInfo:
     """Information about a managed key."""
 
@@ -243,8 +245,7 @@ class KeyProvider(ABC):
         from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            data = len(domain_bytes).to_bytes(2, "big") + domain_bytes + data
+            data = domain_prefix(domain) + data
 
         try:
             pk = Ed25519PublicKey.from_public_bytes(public_key)
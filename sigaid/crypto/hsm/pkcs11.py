@@ -28,6 +28,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from .interface import KeyProvider, KeyInfo, KeyType, KeyUsage
+from ..signing import domain_prefix
 
 
 class PKCS11NotAvailableError(Exception):
@@ -267,8 +268,7 @@ class PKCS11KeyProvider(KeyProvider):
         """Sign data using HSM key."""
         # Apply domain separation
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            data = len(domain_bytes).to_bytes(2, "big") + domain_bytes + data
+            data = domain_prefix(domain) + data
 
         try:
             private_key = self._session.get_key(
@@ -289,8 +289,7 @@ class PKCS11KeyProvider(KeyProvider):
         """Verify signature using HSM key."""
         # Apply domain separation
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            data = len(domain_bytes).to_bytes(2, "big") + domain_bytes + data
+            data = domain_prefix(domain) + data
 
         try:
             public_key = self._session.get_key(
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import secrets
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
@@ -17,6 +17,8 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (
 from cryptography.hazmat.primitives import serialization
 
 from .interface import KeyProvider, KeyInfo, KeyType, KeyUsage
+from ..keys import verify_batch
+from ..signing import domain_prefix
 from ..secure_memory import SecureBytes
 
 
@@ -30,6 +32,8 @@ class SoftwareKeyProvider(KeyProvider):
     def __init__(self):
         """Initialize the software key provider."""
         self._keys: dict[str, _SoftwareKey] = {}
+        # key_id -> raw public key bytes (not sensitive)
+        self._public_keys: dict[str, bytes] = {}
 
     @property
     def provider_name(self) -> str:
@@ -72,6 +76,7 @@ class SoftwareKeyProvider(KeyProvider):
             created_at=datetime.now(timezone.utc),
             label=label,
             exportable=exportable,
+            public_key_bytes=_raw_public_bytes(private_key),
         )
 
         return key_id
@@ -91,7 +96,7 @@ class SoftwareKeyProvider(KeyProvider):
             raise ValueError("Ed25519 private key must be 32 bytes")
 
         # Validate key is valid Ed25519 before storing
-        Ed25519PrivateKey.from_private_bytes(private_key)
+        validated = Ed25519PrivateKey.from_private_bytes(private_key)
 
         key_id = f"sw_{secrets.token_hex(16)}"
         secure_private = SecureBytes(private_key, lock_memory=True)
@@ -104,6 +109,7 @@ class SoftwareKeyProvider(KeyProvider):
             created_at=datetime.now(timezone.utc),
             label=label,
             exportable=True,
+            public_key_bytes=_raw_public_bytes(validated),
         )
 
         return key_id
@@ -117,26 +123,19 @@ class SoftwareKeyProvider(KeyProvider):
 
     def get_public_key(self, key_id: str) -> bytes:
         """Get public key bytes."""
-        key = self._get_key(key_id)
-        return key.get_public_key_bytes()
+        public_key = self._public_keys.get(key_id)
+        if public_key is None:
+            public_key = self._get_key(key_id).get_public_key_bytes()
+            self._public_keys[key_id] = public_key
+        return public_key
 
     def get_key_info(self, key_id: str) -> KeyInfo:
         """Get information about a key."""
-        key = self._get_key(key_id)
-        return KeyInfo(
-            key_id=key.key_id,
-            key_type=key.key_type,
-            usage=key.usage,
-            public_key=self.get_public_key(key_id),
-            created_at=key.created_at,
-            hardware_backed=False,
-            label=key.label,
-            exportable=key.exportable,
-        )
+        return self._key_info(self._get_key(key_id))
 
     def list_keys(self) -> list[KeyInfo]:
         """List all managed keys."""
-        return [self.get_key_info(key_id) for key_id in self._keys]
+        return [self._key_info(key) for key in self._keys.values()]
 
     def delete_key(self, key_id: str) -> bool:
         """Delete a key securely."""
@@ -147,6 +146,7 @@ class SoftwareKeyProvider(KeyProvider):
         # Securely clear the key material
         key.secure_private.clear()
         del self._keys[key_id]
+        self._public_keys.pop(key_id, None)
         return True
 
     def sign(
@@ -163,8 +163,7 @@ class SoftwareKeyProvider(KeyProvider):
 
         # Apply domain separation
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            data = len(domain_bytes).to_bytes(2, "big") + domain_bytes + data
+            data = domain_prefix(domain) + data
 
         # Reconstruct private key for signing operation
         private_key = key.get_private_key()
@@ -182,8 +181,7 @@ class SoftwareKeyProvider(KeyProvider):
 
         # Apply domain separation
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            data = len(domain_bytes).to_bytes(2, "big") + domain_bytes + data
+            data = domain_prefix(domain) + data
 
         try:
             # Use cached public key for verification
@@ -193,6 +191,51 @@ class SoftwareKeyProvider(KeyProvider):
         except Exception:
             return False
 
+    def verify_batch(
+        self,
+        public_keys: Sequence[bytes],
+        signatures: Sequence[bytes],
+        data: Sequence[bytes],
+        domain: str | None = None,
+    ) -> list[bool]:
+        """Verify many signatures under a single domain.
+
+        Takes the same arguments as sigaid.crypto.keys.verify_batch(), which
+        does the work: the domain prefix is encoded once for the whole batch
+        and decoded public keys are cached across calls.
+
+        Args:
+            public_keys: 32-byte Ed25519 public keys
+            signatures: Signatures, parallel to public_keys
+            data: Signed data, parallel to public_keys
+            domain: Domain separation tag used when signing, or None if
+                the data was signed without one
+
+        Returns:
+            List of booleans, one per signature, in input order
+
+        Raises:
+            ValueError: If the three sequences differ in length
+        """
+        return verify_batch(public_keys, signatures, data, domain=domain)
+
+    def _key_info(self, key: "_SoftwareKey") -> KeyInfo:
+        """Build KeyInfo for a stored key without re-resolving its ID."""
+        public_key = self._public_keys.get(key.key_id)
+        if public_key is None:
+            public_key = key.get_public_key_bytes()
+            self._public_keys[key.key_id] = public_key
+        return KeyInfo(
+            key_id=key.key_id,
+            key_type=key.key_type,
+            usage=key.usage,
+            public_key=public_key,
+            created_at=key.created_at,
+            hardware_backed=False,
+            label=key.label,
+            exportable=key.exportable,
+        )
+
     def _get_key(self, key_id: str) -> "_SoftwareKey":
         """Get a key by ID."""
         if key_id not in self._keys:
@@ -207,6 +250,17 @@ class _SoftwareKey:
     The Ed25519PrivateKey object is reconstructed on demand for operations.
     """
 
+    __slots__ = (
+        "key_id",
+        "key_type",
+        "usage",
+        "secure_private",
+        "created_at",
+        "label",
+        "exportable",
+        "_public_key_bytes",
+    )
+
     def __init__(
         self,
         key_id: str,
@@ -216,6 +270,7 @@ class _SoftwareKey:
         created_at: datetime,
         label: Optional[str] = None,
         exportable: bool = True,
+        public_key_bytes: Optional[bytes] = None,
     ):
         self.key_id = key_id
         self.key_type = key_type
@@ -225,7 +280,7 @@ class _SoftwareKey:
         self.label = label
         self.exportable = exportable
         # Cache public key bytes (not sensitive)
-        self._public_key_bytes: Optional[bytes] = None
+        self._public_key_bytes: Optional[bytes] = public_key_bytes
 
     def get_private_key(self) -> Ed25519PrivateKey:
         """Reconstruct Ed25519PrivateKey from secure storage."""
@@ -234,9 +289,13 @@ class _SoftwareKey:
     def get_public_key_bytes(self) -> bytes:
         """Get public key bytes (cached for performance)."""
         if self._public_key_bytes is None:
-            pk = self.get_private_key()
-            self._public_key_bytes = pk.public_key().public_bytes(
-                encoding=serialization.Encoding.Raw,
-                format=serialization.PublicFormat.Raw,
-            )
+            self._public_key_bytes = _raw_public_bytes(self.get_private_key())
         return self._public_key_bytes
+
+
+def _raw_public_bytes(private_key: Ed25519PrivateKey) -> bytes:
+    """Raw 32-byte public key for an Ed25519 private key."""
+    return private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw,
+    )
@@ -34,9 +34,9 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import struct
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 from pathlib import Path
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
@@ -45,6 +45,7 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (
 )
 from cryptography.hazmat.primitives import serialization
 
+from sigaid.crypto.signing import domain_prefix
 from sigaid.exceptions import CryptoError
 
 # Hybrid signature version
@@ -65,7 +66,11 @@ HYBRID_PUBLIC_SIZE = ED25519_PUBLIC_SIZE + DILITHIUM3_PUBLIC_SIZE
 HYBRID_PRIVATE_SIZE = ED25519_PRIVATE_SIZE + DILITHIUM3_PRIVATE_SIZE
 HYBRID_SIGNATURE_SIZE = 1 + ED25519_SIGNATURE_SIZE + DILITHIUM3_SIGNATURE_SIZE
 
+# Version byte that prefixes every hybrid signature
+_HYBRID_PREFIX = bytes([HYBRID_VERSION])
 
+
+@functools.lru_cache(maxsize=1)
 def _check_pqcrypto_available() -> bool:
     """Check if post-quantum crypto library is available."""
     try:
@@ -75,6 +80,7 @@ def _check_pqcrypto_available() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def _check_liboqs_available() -> bool:
     """Check if liboqs is available."""
     try:
@@ -89,24 +95,115 @@ class PostQuantumNotAvailableError(Exception):
     pass
 
 
-@dataclass
 class HybridPublicKey:
-    """Combined Ed25519 + Dilithium public key."""
-    ed25519_public: bytes  # 32 bytes
-    dilithium_public: bytes  # 1952 bytes
+    """Combined Ed25519 + Dilithium public key.
+
+    Backed by a single serialized buffer (Ed25519 key followed by the
+    Dilithium key), so to_bytes() and from_bytes() do not copy.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self, ed25519_public: bytes, dilithium_public: bytes):
+        """Combine the two public keys.
+
+        Args:
+            ed25519_public: 32-byte Ed25519 public key
+            dilithium_public: 1952-byte Dilithium-3 public key
+        """
+        self._buf = bytes(ed25519_public) + bytes(dilithium_public)
+
+    @property
+    def ed25519_public(self) -> bytes:
+        """Ed25519 public key (32 bytes)."""
+        return self._buf[:ED25519_PUBLIC_SIZE]
+
+    @property
+    def dilithium_public(self) -> bytes:
+        """Dilithium-3 public key (1952 bytes)."""
+        return self._buf[ED25519_PUBLIC_SIZE:]
 
     def to_bytes(self) -> bytes:
         """Serialize to bytes."""
-        return self.ed25519_public + self.dilithium_public
+        return self._buf
 
     @classmethod
     def from_bytes(cls, data: bytes) -> HybridPublicKey:
         """Deserialize from bytes."""
         if len(data) != HYBRID_PUBLIC_SIZE:
             raise ValueError(f"Expected {HYBRID_PUBLIC_SIZE} bytes, got {len(data)}")
-        return cls(
-            ed25519_public=data[:ED25519_PUBLIC_SIZE],
-            dilithium_public=data[ED25519_PUBLIC_SIZE:],
+        instance = object.__new__(cls)
+        instance._buf = bytes(data)
+        return instance
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HybridPublicKey):
+            return self._buf == other._buf
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._buf)
+
+    def __repr__(self) -> str:
+        return f"HybridPublicKey(ed25519_public={self.ed25519_public.hex()})"
+
+
+class HybridPublicKeyArray:
+    """Compact store for many hybrid public keys.
+
+    Keeps the Ed25519 halves and the Dilithium halves in two contiguous
+    arenas instead of one object per key, which suits verifiers that
+    cache large numbers of peer keys.
+
+    Example:
+        keys = HybridPublicKeyArray([pk1, pk2])
+        assert keys[1] == pk2
+        ed25519_keys = keys.ed25519_arena  # 32 * len(keys) bytes
+    """
+
+    __slots__ = ("_ed25519", "_dilithium", "_count")
+
+    def __init__(self, keys: Iterable[HybridPublicKey] = ()):
+        """Build the arenas from hybrid public keys.
+
+        Args:
+            keys: Hybrid public keys to store, in index order
+        """
+        ed25519 = bytearray()
+        dilithium = bytearray()
+        count = 0
+        for key in keys:
+            buf = key.to_bytes()
+            ed25519 += buf[:ED25519_PUBLIC_SIZE]
+            dilithium += buf[ED25519_PUBLIC_SIZE:]
+            count += 1
+        self._ed25519 = bytes(ed25519)
+        self._dilithium = bytes(dilithium)
+        self._count = count
+
+    @property
+    def ed25519_arena(self) -> bytes:
+        """All Ed25519 public keys, concatenated (32 bytes each)."""
+        return self._ed25519
+
+    @property
+    def dilithium_arena(self) -> bytes:
+        """All Dilithium public keys, concatenated (1952 bytes each)."""
+        return self._dilithium
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> HybridPublicKey:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("HybridPublicKeyArray index out of range")
+        ed_start = index * ED25519_PUBLIC_SIZE
+        dl_start = index * DILITHIUM3_PUBLIC_SIZE
+        return HybridPublicKey.from_bytes(
+            self._ed25519[ed_start:ed_start + ED25519_PUBLIC_SIZE]
+            + self._dilithium[dl_start:dl_start + DILITHIUM3_PUBLIC_SIZE]
         )
 
 
@@ -221,8 +318,7 @@ class HybridKeyPair:
         """
         # Apply domain separation
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            message = len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
+            message = domain_prefix(domain) + message
 
         # Sign with Ed25519
         ed25519_sig = self._ed25519_private.sign(message)
@@ -256,8 +352,7 @@ class HybridKeyPair:
             64-byte Ed25519 signature (no version prefix)
         """
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            message = len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
+            message = domain_prefix(domain) + message
 
         return self._ed25519_private.sign(message)
 
@@ -286,8 +381,7 @@ class HybridKeyPair:
 
         # Apply domain separation
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            message = len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
+            message = domain_prefix(domain) + message
 
         # Verify Ed25519
         try:
@@ -340,8 +434,7 @@ class HybridKeyPair:
 
         # Apply domain separation
         if domain:
-            domain_bytes = domain.encode("utf-8")
-            message = len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
+            message = domain_prefix(domain) + message
 
         try:
             self._ed25519_public.verify(ed25519_sig, message)
@@ -384,8 +477,7 @@ def verify_hybrid_signature(
 
     # Apply domain separation
     if domain:
-        domain_bytes = domain.encode("utf-8")
-        message = len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
+        message = domain_prefix(domain) + message
 
     # Verify Ed25519
     try:
@@ -425,6 +517,6 @@ def is_hybrid_signature(signature: bytes) -> bool:
     Returns:
         True if this is a hybrid signature (has version prefix)
     """
-    if not signature or len(signature) < 1:
+    if not signature:
         return False
-    return signature[0] == HYBRID_VERSION and len(signature) > ED25519_SIGNATURE_SIZE
+    return len(signature) > ED25519_SIGNATURE_SIZE and signature.startswith(_HYBRID_PREFIX)
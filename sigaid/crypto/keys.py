@@ -6,7 +6,7 @@ import json
 import os
 import secrets
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
@@ -19,13 +19,13 @@ from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 
 from sigaid.constants import (
     ED25519_PRIVATE_KEY_SIZE,
-    ED25519_PUBLIC_KEY_SIZE,
     KEYFILE_ALGORITHM,
     KEYFILE_VERSION,
     SCRYPT_N,
     SCRYPT_P,
     SCRYPT_R,
 )
+from sigaid.crypto.signing import domain_prefix, load_public_key
 from sigaid.exceptions import CryptoError, InvalidKey, KeyDerivationError
 
 if TYPE_CHECKING:
@@ -65,6 +65,14 @@ class KeyPair:
         """
         self._private_key = private_key
         self._public_key = private_key.public_key()
+        self._public_key_bytes = self._public_key.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw,
+        )
+        # Derived lazily by to_agent_id()
+        self._agent_id: AgentID | None = None
+        # (salt, purpose) -> key; filled by derive_session_key()
+        self._derived_keys: dict[tuple[bytes | None, str], bytes] = {}
 
     @classmethod
     def generate(cls) -> KeyPair:
@@ -146,10 +154,7 @@ class KeyPair:
         Returns:
             64-byte signature
         """
-        domain_bytes = domain.encode("utf-8")
-        tagged_message = (
-            len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
-        )
+        tagged_message = domain_prefix(domain) + message
         return self._private_key.sign(tagged_message)
 
     def verify(self, signature: bytes, message: bytes) -> bool:
@@ -181,16 +186,42 @@ class KeyPair:
         Returns:
             True if valid, False otherwise
         """
-        domain_bytes = domain.encode("utf-8")
-        tagged_message = (
-            len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
-        )
+        tagged_message = domain_prefix(domain) + message
         try:
             self._public_key.verify(signature, tagged_message)
             return True
         except Exception:
             return False
 
+    def verify_batch(
+        self,
+        signatures: Sequence[bytes],
+        messages: Sequence[bytes],
+        domain: str | None = None,
+    ) -> list[bool]:
+        """
+        Verify many signatures made by this keypair.
+        
+        Args:
+            signatures: 64-byte signatures to verify
+            messages: Original messages, parallel to signatures
+            domain: Domain string used during signing, if the signatures
+                were made with sign_with_domain()
+            
+        Returns:
+            List of booleans, one per signature, in input order
+            
+        Raises:
+            ValueError: If signatures and messages differ in length
+        """
+        if len(signatures) != len(messages):
+            raise ValueError("signatures and messages must have the same length")
+        prefix = domain_prefix(domain) if domain is not None else b""
+        return [
+            _verify(self._public_key, signature, prefix + message)
+            for signature, message in zip(signatures, messages)
+        ]
+
     def public_key_bytes(self) -> bytes:
         """
         Get raw public key bytes (32 bytes).
@@ -198,10 +229,7 @@ class KeyPair:
         Returns:
             32-byte public key
         """
-        return self._public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw,
-        )
+        return self._public_key_bytes
 
     def private_key_bytes(self) -> bytes:
         """
@@ -218,34 +246,52 @@ class KeyPair:
             encryption_algorithm=serialization.NoEncryption(),
         )
 
-    def derive_session_key(self, session_id: bytes, purpose: str = "session") -> bytes:
+    def derive_session_key(
+        self, session_id: bytes | None, purpose: str = "session"
+    ) -> bytes:
         """
         Derive a session-specific key using HKDF.
         
+        Derived keys are cached per (session_id, purpose) until
+        clear_derived_keys() is called.
+        
         Args:
-            session_id: Unique session identifier
+            session_id: Unique session identifier, used as the HKDF salt
             purpose: Key purpose string for domain separation
             
         Returns:
             32-byte derived key
         """
-        hkdf = HKDF(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=session_id,
-            info=purpose.encode("utf-8"),
-        )
-        return hkdf.derive(self.private_key_bytes())
+        cache_key = (session_id, purpose)
+        key = self._derived_keys.get(cache_key)
+        if key is None:
+            hkdf = HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=session_id,
+                info=purpose.encode("utf-8"),
+            )
+            key = hkdf.derive(self.private_key_bytes())
+            self._derived_keys[cache_key] = key
+        return key
+
+    def clear_derived_keys(self) -> None:
+        """Drop every key cached by derive_session_key()."""
+        self._derived_keys.clear()
 
     def to_agent_id(self) -> AgentID:
         """
         Derive AgentID from public key.
         
+        The AgentID is computed on first use and reused afterwards.
+        
         Returns:
             AgentID instance
         """
-        from sigaid.identity.agent_id import AgentID
-        return AgentID.from_public_key(self.public_key_bytes())
+        if self._agent_id is None:
+            from sigaid.identity.agent_id import AgentID
+            self._agent_id = AgentID.from_public_key(self.public_key_bytes())
+        return self._agent_id
 
     def to_encrypted_file(self, path: Path, password: str) -> None:
         """
@@ -364,14 +410,8 @@ def verify_signature_with_public_key(
     Returns:
         True if valid, False otherwise
     """
-    if len(public_key) != ED25519_PUBLIC_KEY_SIZE:
-        return False
-    try:
-        pk = Ed25519PublicKey.from_public_bytes(public_key)
-        pk.verify(signature, message)
-        return True
-    except Exception:
-        return False
+    pk = load_public_key(public_key)
+    return pk is not None and _verify(pk, signature, message)
 
 
 def verify_signature_with_public_key_and_domain(
@@ -389,15 +429,53 @@ def verify_signature_with_public_key_and_domain(
     Returns:
         True if valid, False otherwise
     """
-    if len(public_key) != ED25519_PUBLIC_KEY_SIZE:
+    pk = load_public_key(public_key)
+    if pk is None:
         return False
-    domain_bytes = domain.encode("utf-8")
-    tagged_message = (
-        len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
-    )
+    tagged_message = domain_prefix(domain) + message
+    return _verify(pk, signature, tagged_message)
+
+
+def verify_batch(
+    public_keys: Sequence[bytes],
+    signatures: Sequence[bytes],
+    messages: Sequence[bytes],
+    domain: str | None = None,
+) -> list[bool]:
+    """
+    Verify many signatures using raw public key bytes.
+    
+    Decoded public keys are cached, so verifying many signatures from
+    the same signers skips repeated key parsing.
+    
+    Args:
+        public_keys: 32-byte Ed25519 public keys
+        signatures: 64-byte signatures, parallel to public_keys
+        messages: Original messages, parallel to public_keys
+        domain: Domain string used during signing, if the signatures
+            were domain-separated
+        
+    Returns:
+        List of booleans, one per signature, in input order
+        
+    Raises:
+        ValueError: If the three sequences differ in length
+    """
+    if not len(public_keys) == len(signatures) == len(messages):
+        raise ValueError("public_keys, signatures and messages must have the same length")
+
+    prefix = domain_prefix(domain) if domain is not None else b""
+    results = []
+    for public_key, signature, message in zip(public_keys, signatures, messages):
+        pk = load_public_key(public_key)
+        results.append(pk is not None and _verify(pk, signature, prefix + message))
+    return results
+
+
+def _verify(public_key: Ed25519PublicKey, signature: bytes, message: bytes) -> bool:
+    """Verify a signature, returning False instead of raising."""
     try:
-        pk = Ed25519PublicKey.from_public_bytes(public_key)
-        pk.verify(signature, tagged_message)
+        public_key.verify(signature, message)
         return True
     except Exception:
         return False
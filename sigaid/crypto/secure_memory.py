@@ -53,10 +53,32 @@ except OSError:
     logger.warning("Could not load libc for secure memory operations")
 
 
+def _get_libc_func(name: str, restype):
+    """Resolve a libc function taking (void *addr, size_t len), or None."""
+    if _libc is None:
+        return None
+    try:
+        func = getattr(_libc, name)
+    except AttributeError:
+        return None
+    func.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    func.restype = restype
+    return func
+
+
+# Resolved once at import so each call skips the symbol lookup.
+# explicit_bzero exists on glibc >= 2.25 and the BSDs; secure_zero falls
+# back to memset elsewhere.
+_explicit_bzero = _get_libc_func("explicit_bzero", None)
+_mlock = _get_libc_func("mlock", ctypes.c_int)
+_munlock = _get_libc_func("munlock", ctypes.c_int)
+
+
 def secure_zero(data: bytearray | memoryview) -> None:
     """Securely zero out memory containing sensitive data.
 
-    Uses ctypes.memset for reliable zeroing that won't be optimized away.
+    Uses libc's explicit_bzero where available and ctypes.memset otherwise,
+    so the wipe is a single C call that won't be optimized away.
 
     Args:
         data: Mutable buffer to zero (bytearray or memoryview)
@@ -72,17 +94,16 @@ def secure_zero(data: bytearray | memoryview) -> None:
     if not data:
         return
 
-    if isinstance(data, memoryview):
-        # Get the underlying buffer address
-        buf = (ctypes.c_char * len(data)).from_buffer(data)
-        ctypes.memset(ctypes.addressof(buf), 0, len(data))
-    elif isinstance(data, bytearray):
-        # Create a ctypes array that shares the bytearray's buffer
-        buf = (ctypes.c_char * len(data)).from_buffer(data)
-        ctypes.memset(ctypes.addressof(buf), 0, len(data))
-    else:
+    if not isinstance(data, (bytearray, memoryview)):
         raise TypeError(f"Cannot securely zero {type(data).__name__}, use bytearray or memoryview")
 
+    # Create a ctypes array that shares the buffer
+    buf = (ctypes.c_char * len(data)).from_buffer(data)
+    if _explicit_bzero is not None:
+        _explicit_bzero(ctypes.addressof(buf), len(data))
+    else:
+        ctypes.memset(ctypes.addressof(buf), 0, len(data))
+
 
 def mlock(data: bytearray | memoryview) -> bool:
     """Lock memory to prevent swapping to disk.
@@ -93,23 +114,18 @@ def mlock(data: bytearray | memoryview) -> bool:
     Returns:
         True if successfully locked, False otherwise
     """
-    if not _libc:
+    if _mlock is None:
         return False
 
     if not data:
         return True
 
-    try:
-        if isinstance(data, memoryview):
-            buf = (ctypes.c_char * len(data)).from_buffer(data)
-            addr = ctypes.addressof(buf)
-        elif isinstance(data, bytearray):
-            buf = (ctypes.c_char * len(data)).from_buffer(data)
-            addr = ctypes.addressof(buf)
-        else:
-            return False
+    if not isinstance(data, (bytearray, memoryview)):
+        return False
 
-        result = _libc.mlock(ctypes.c_void_p(addr), ctypes.c_size_t(len(data)))
+    try:
+        buf = (ctypes.c_char * len(data)).from_buffer(data)
+        result = _mlock(ctypes.addressof(buf), len(data))
 
         if result != 0:
             errno = ctypes.get_errno()
@@ -134,23 +150,18 @@ def munlock(data: bytearray | memoryview) -> bool:
     Returns:
         True if successfully unlocked, False otherwise
     """
-    if not _libc:
+    if _munlock is None:
         return False
 
     if not data:
         return True
 
-    try:
-        if isinstance(data, memoryview):
-            buf = (ctypes.c_char * len(data)).from_buffer(data)
-            addr = ctypes.addressof(buf)
-        elif isinstance(data, bytearray):
-            buf = (ctypes.c_char * len(data)).from_buffer(data)
-            addr = ctypes.addressof(buf)
-        else:
-            return False
+    if not isinstance(data, (bytearray, memoryview)):
+        return False
 
-        result = _libc.munlock(ctypes.c_void_p(addr), ctypes.c_size_t(len(data)))
+    try:
+        buf = (ctypes.c_char * len(data)).from_buffer(data)
+        result = _munlock(ctypes.addressof(buf), len(data))
         return result == 0
     except Exception:
         return False
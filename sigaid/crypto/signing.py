@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
     Ed25519PublicKey,
@@ -42,12 +44,9 @@ def verify(public_key: bytes | Ed25519PublicKey, signature: bytes, message: byte
     if len(signature) != ED25519_SIGNATURE_SIZE:
         return False
     
-    if isinstance(public_key, bytes):
-        if len(public_key) != ED25519_PUBLIC_KEY_SIZE:
-            return False
-        try:
-            public_key = Ed25519PublicKey.from_public_bytes(public_key)
-        except Exception:
+    if not isinstance(public_key, Ed25519PublicKey):
+        public_key = load_public_key(public_key)
+        if public_key is None:
             return False
     
     try:
@@ -104,12 +103,9 @@ def verify_with_domain(
     if len(signature) != ED25519_SIGNATURE_SIZE:
         return False
     
-    if isinstance(public_key, bytes):
-        if len(public_key) != ED25519_PUBLIC_KEY_SIZE:
-            return False
-        try:
-            public_key = Ed25519PublicKey.from_public_bytes(public_key)
-        except Exception:
+    if not isinstance(public_key, Ed25519PublicKey):
+        public_key = load_public_key(public_key)
+        if public_key is None:
             return False
     
     tagged_message = _create_tagged_message(message, domain)
@@ -121,16 +117,72 @@ def verify_with_domain(
         return False
 
 
+def load_public_key(public_key: bytes | bytearray | memoryview) -> Ed25519PublicKey | None:
+    """
+    Decode raw public key bytes, returning None if invalid.
+    
+    Args:
+        public_key: 32-byte public key in any bytes-like form
+        
+    Returns:
+        Decoded public key, or None if the input is not a valid key
+    """
+    if not isinstance(public_key, bytes):
+        try:
+            public_key = bytes(public_key)
+        except (TypeError, ValueError):
+            return None
+    return _decode_public_key(public_key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_public_key(public_key: bytes) -> Ed25519PublicKey | None:
+    """
+    Decode and cache a public key.
+    
+    Decoded keys are cached so repeated verification against the same
+    peer skips re-parsing the key.
+    """
+    if len(public_key) != ED25519_PUBLIC_KEY_SIZE:
+        return None
+    try:
+        return Ed25519PublicKey.from_public_bytes(public_key)
+    except Exception:
+        return None
+
+
 def _create_tagged_message(message: bytes, domain: str) -> bytes:
     """
     Create domain-tagged message for signing.
     
     Format: [2-byte domain length BE][domain bytes][message bytes]
     """
+    return domain_prefix(domain) + message
+
+
+@functools.lru_cache(maxsize=64)
+def domain_prefix(domain: str) -> bytes:
+    """
+    Encode the tag placed before domain-separated messages.
+    
+    Format: [2-byte domain length BE][domain bytes]. Every string, including
+    the empty one, is encoded; callers that treat a missing domain as "no
+    separation" skip the prefix instead. Only a handful of fixed domains are
+    used, so each prefix is built once.
+    
+    Args:
+        domain: Domain string (e.g., "sigaid.identity.v1")
+        
+    Returns:
+        Prefix bytes to place before the message
+        
+    Raises:
+        ValueError: If the encoded domain exceeds 65535 bytes
+    """
     domain_bytes = domain.encode("utf-8")
     if len(domain_bytes) > 65535:
         raise ValueError("Domain string too long (max 65535 bytes)")
-    return len(domain_bytes).to_bytes(2, "big") + domain_bytes + message
+    return len(domain_bytes).to_bytes(2, "big") + domain_bytes
 
 
 def extract_public_key(private_key: bytes) -> bytes:
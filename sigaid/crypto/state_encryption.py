@@ -15,13 +15,12 @@ The state chain signatures remain valid regardless of encryption status.
 
 from __future__ import annotations
 
+import json
 import os
 import struct
 from typing import TYPE_CHECKING
 
 from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
-from cryptography.hazmat.primitives import hashes
 
 from sigaid.exceptions import CryptoError
 
@@ -63,27 +62,26 @@ class StateEncryptor:
             salt: Optional salt for key derivation. Use a unique salt per
                   context (e.g., agent_id bytes) for better security.
                   If None, derivation is deterministic from the private key.
+
+        The key derivation runs once here; encrypt() and decrypt() reuse
+        the resulting cipher.
         """
         self._keypair = keypair
         self._salt = salt
         self._encryption_key = self._derive_encryption_key()
+        self._cipher = ChaCha20Poly1305(self._encryption_key)
 
     def _derive_encryption_key(self) -> bytes:
         """Derive encryption key from agent's keypair using HKDF.
 
-        Uses the private key as input key material.
+        Uses the private key as input key material. The keypair caches the
+        result per salt, so repeated encryptors skip the derivation until
+        KeyPair.clear_derived_keys() is called.
         """
-        private_key = self._keypair.private_key_bytes()
-
-        hkdf = HKDF(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self._salt,  # Optional salt for non-deterministic derivation
-            info=STATE_ENCRYPTION_DOMAIN,
+        return self._keypair.derive_session_key(
+            self._salt, STATE_ENCRYPTION_DOMAIN.decode("ascii")
         )
 
-        return hkdf.derive(private_key)
-
     def encrypt(self, plaintext: bytes) -> bytes:
         """Encrypt data with authenticated encryption.
 
@@ -102,8 +100,7 @@ class StateEncryptor:
         nonce = os.urandom(12)
 
         # Encrypt with ChaCha20-Poly1305
-        cipher = ChaCha20Poly1305(self._encryption_key)
-        ciphertext = cipher.encrypt(nonce, plaintext, None)
+        ciphertext = self._cipher.encrypt(nonce, plaintext, None)
 
         # Pack: version (1 byte) + nonce (12 bytes) + ciphertext
         return struct.pack("B", ENCRYPTION_VERSION) + nonce + ciphertext
@@ -137,8 +134,7 @@ class StateEncryptor:
 
         # Decrypt
         try:
-            cipher = ChaCha20Poly1305(self._encryption_key)
-            return cipher.decrypt(nonce, ciphertext, None)
+            return self._cipher.decrypt(nonce, ciphertext, None)
         except Exception as e:
             raise CryptoError(f"Decryption failed: {e}") from e
 
@@ -167,7 +163,7 @@ class StateEncryptionHelper:
         Returns:
             Encrypted summary bytes
         """
-        return self._encryptor.encrypt(summary.encode("utf-8"))
+        return self.encrypt_summary_bytes(summary.encode("utf-8"))
 
     def decrypt_summary(self, encrypted: bytes) -> str:
         """Decrypt action summary.
@@ -178,7 +174,30 @@ class StateEncryptionHelper:
         Returns:
             Original summary string
         """
-        return self._encryptor.decrypt(encrypted).decode("utf-8")
+        return self.decrypt_summary_bytes(encrypted).decode("utf-8")
+
+    def encrypt_summary_bytes(self, summary: bytes) -> bytes:
+        """Encrypt an already UTF-8 encoded action summary.
+
+        Args:
+            summary: UTF-8 encoded summary
+
+        Returns:
+            Encrypted summary bytes
+        """
+        return self._encryptor.encrypt(summary)
+
+    def decrypt_summary_bytes(self, encrypted: bytes) -> bytes:
+        """Decrypt action summary without decoding it.
+
+        Args:
+            encrypted: Encrypted summary from encrypt_summary() or
+                encrypt_summary_bytes()
+
+        Returns:
+            UTF-8 encoded summary
+        """
+        return self._encryptor.decrypt(encrypted)
 
     def encrypt_action_data(self, data: dict) -> bytes:
         """Encrypt action data dictionary.
@@ -189,8 +208,7 @@ class StateEncryptionHelper:
         Returns:
             Encrypted JSON bytes
         """
-        import json
-        json_bytes = json.dumps(data, sort_keys=True).encode("utf-8")
+        json_bytes = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
         return self._encryptor.encrypt(json_bytes)
 
     def decrypt_action_data(self, encrypted: bytes) -> dict:
@@ -202,9 +220,7 @@ class StateEncryptionHelper:
         Returns:
             Original action data dictionary
         """
-        import json
-        decrypted = self._encryptor.decrypt(encrypted)
-        return json.loads(decrypted.decode("utf-8"))
+        return json.loads(self._encryptor.decrypt(encrypted))
 
     @staticmethod
     def is_encrypted(data: bytes) -> bool:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, Sequence
 
 import pyseto
 from pyseto import Key
@@ -14,6 +14,15 @@ from sigaid.constants import PASETO_KEY_SIZE
 from sigaid.exceptions import TokenError, TokenExpired, TokenInvalid
 
 
+# Claims set by create_token() that extra_claims may not override
+_RESERVED_CLAIMS = frozenset({"agent_id", "session_id", "iat", "exp", "jti", "seq"})
+
+
+def _utc_now() -> datetime:
+    """Default clock for token timestamps."""
+    return datetime.now(timezone.utc)
+
+
 class LeaseTokenManager:
     """
     PASETO v4 token management for lease operations.
@@ -33,7 +42,17 @@ class LeaseTokenManager:
         payload = manager.verify_token(token)
     """
 
-    def __init__(self, secret_key: bytes):
+    # Every token this manager issues starts with this header
+    TOKEN_HEADER = "v4.local."
+
+    # Maximum number of verified tokens remembered by verify_token()
+    VERIFIED_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        secret_key: bytes,
+        clock: Callable[[], datetime] | None = None,
+    ):
         """
         Initialize with 32-byte secret key.
         
@@ -42,6 +61,8 @@ class LeaseTokenManager:
         
         Args:
             secret_key: 32-byte secret key for token encryption
+            clock: Optional callable returning the current UTC datetime
+                (defaults to datetime.now(timezone.utc))
             
         Raises:
             TokenError: If secret key is invalid
@@ -49,6 +70,9 @@ class LeaseTokenManager:
         if len(secret_key) != PASETO_KEY_SIZE:
             raise ValueError(f"Secret key must be {PASETO_KEY_SIZE} bytes, got {len(secret_key)}")
         self._key = Key.new(version=4, purpose="local", key=secret_key)
+        self._clock = clock or _utc_now
+        # token -> (decrypted payload bytes, expiry); see verify_token()
+        self._verified: dict[str, tuple[bytes, datetime]] = {}
 
     @classmethod
     def generate_key(cls) -> bytes:
@@ -83,7 +107,7 @@ class LeaseTokenManager:
         Returns:
             PASETO token string
         """
-        now = datetime.now(timezone.utc)
+        now = self._clock()
 
         payload = {
             "agent_id": agent_id,
@@ -99,8 +123,7 @@ class LeaseTokenManager:
 
         if extra_claims:
             # Prevent overriding critical security claims
-            reserved_claims = {"agent_id", "session_id", "iat", "exp", "jti", "seq"}
-            forbidden = reserved_claims & extra_claims.keys()
+            forbidden = _RESERVED_CLAIMS & extra_claims.keys()
             if forbidden:
                 raise ValueError(
                     f"Cannot override reserved claims: {', '.join(sorted(forbidden))}"
@@ -116,6 +139,10 @@ class LeaseTokenManager:
         """
         Verify and decode lease token.
 
+        Tokens that verified successfully are remembered, so presenting the
+        same token again skips decryption. Expiry is still checked on every
+        call.
+
         Args:
             token: PASETO token string
 
@@ -126,10 +153,25 @@ class LeaseTokenManager:
             TokenExpired: If token has expired
             TokenInvalid: If token is invalid or tampered
         """
+        if not isinstance(token, str):
+            raise TokenInvalid(f"Invalid token: expected str, got {type(token).__name__}")
+
+        cached = self._verified.get(token)
+        if cached is not None:
+            payload_bytes, exp = cached
+            if exp < self._clock():
+                self._verified.pop(token, None)
+                raise TokenExpired(f"Token expired at {exp.isoformat()}")
+            return json.loads(payload_bytes)
+
+        if not token.startswith(self.TOKEN_HEADER):
+            raise TokenInvalid("Invalid token: expected v4.local token")
+
         try:
             decoded = pyseto.decode(self._key, token.encode("utf-8"))
             # pyseto returns bytes, decode as JSON
-            payload = json.loads(decoded.payload.decode("utf-8"))
+            payload_bytes = decoded.payload
+            payload = json.loads(payload_bytes.decode("utf-8"))
         except json.JSONDecodeError as e:
             raise TokenInvalid(f"Invalid token payload: {e}") from e
         except Exception as e:
@@ -138,15 +180,46 @@ class LeaseTokenManager:
         # Check expiration
         try:
             exp = datetime.fromisoformat(payload["exp"])
-            if exp < datetime.now(timezone.utc):
+            if exp < self._clock():
                 raise TokenExpired(f"Token expired at {payload['exp']}")
         except KeyError:
             raise TokenInvalid("Token missing expiration claim")
         except ValueError as e:
             raise TokenInvalid(f"Invalid expiration format: {e}") from e
 
+        if len(self._verified) >= self.VERIFIED_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._verified.pop(next(iter(self._verified)), None)
+        self._verified[token] = (payload_bytes, exp)
+
         return payload
 
+    def verify_tokens(self, tokens: Sequence[str]) -> list[dict[str, Any] | TokenError]:
+        """
+        Verify many lease tokens at once.
+
+        A failure on one token does not stop the rest of the batch, and
+        repeated tokens are decrypted only once (see verify_token()).
+
+        Args:
+            tokens: PASETO token strings
+
+        Returns:
+            For each token, in order, its decoded payload or the TokenExpired /
+            TokenInvalid error it raised
+        """
+        results: list[dict[str, Any] | TokenError] = []
+        for token in tokens:
+            try:
+                results.append(self.verify_token(token))
+            except TokenError as e:
+                results.append(e)
+        return results
+
+    def clear_cache(self) -> None:
+        """Forget all previously verified tokens."""
+        self._verified.clear()
+
     def refresh_token(
         self,
         old_token: str,
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import hmac
 import re
 from typing import TYPE_CHECKING
 
@@ -64,35 +66,8 @@ class AgentID:
         Raises:
             InvalidAgentID: If format is invalid or checksum fails
         """
-        if not value.startswith(AGENT_ID_PREFIX):
-            raise InvalidAgentID(f"AgentID must start with '{AGENT_ID_PREFIX}', got: {value[:10]}...")
-        
-        if not AGENT_ID_PATTERN.match(value):
-            raise InvalidAgentID(f"Invalid AgentID format: {value}")
-        
-        # Decode and verify checksum
-        try:
-            encoded = value[len(AGENT_ID_PREFIX):]
-            decoded = base58.b58decode(encoded)
-        except Exception as e:
-            raise InvalidAgentID(f"Invalid Base58 encoding: {e}") from e
-        
-        if len(decoded) != ED25519_PUBLIC_KEY_SIZE + 4:
-            raise InvalidAgentID(
-                f"Decoded AgentID has wrong length: {len(decoded)}, "
-                f"expected {ED25519_PUBLIC_KEY_SIZE + 4}"
-            )
-        
-        public_key = decoded[:ED25519_PUBLIC_KEY_SIZE]
-        checksum = decoded[ED25519_PUBLIC_KEY_SIZE:]
-        
-        # Verify checksum
-        expected_checksum = self._compute_checksum(public_key)
-        if checksum != expected_checksum:
-            raise InvalidAgentID("AgentID checksum verification failed")
-        
+        self._public_key = _decode_agent_id(value)
         self._value = value
-        self._public_key = public_key
     
     @classmethod
     def from_public_key(cls, public_key: bytes) -> AgentID:
@@ -213,3 +188,44 @@ class AgentID:
         if len(encoded) <= length:
             return self._value
         return f"{AGENT_ID_PREFIX}{encoded[:length]}..."
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_agent_id(value: str) -> bytes:
+    """
+    Validate an AgentID string and return its embedded public key.
+    
+    Results are memoized, so parsing the same AgentID string again skips
+    the Base58 decode and checksum. Invalid strings raise and are not cached.
+    
+    Raises:
+        InvalidAgentID: If format is invalid or checksum fails
+    """
+    if not value.startswith(AGENT_ID_PREFIX):
+        raise InvalidAgentID(f"AgentID must start with '{AGENT_ID_PREFIX}', got: {value[:10]}...")
+    
+    if not AGENT_ID_PATTERN.match(value):
+        raise InvalidAgentID(f"Invalid AgentID format: {value}")
+    
+    # Decode and verify checksum
+    try:
+        encoded = value[len(AGENT_ID_PREFIX):]
+        decoded = base58.b58decode(encoded)
+    except Exception as e:
+        raise InvalidAgentID(f"Invalid Base58 encoding: {e}") from e
+    
+    if len(decoded) != ED25519_PUBLIC_KEY_SIZE + 4:
+        raise InvalidAgentID(
+            f"Decoded AgentID has wrong length: {len(decoded)}, "
+            f"expected {ED25519_PUBLIC_KEY_SIZE + 4}"
+        )
+    
+    public_key = decoded[:ED25519_PUBLIC_KEY_SIZE]
+    checksum = decoded[ED25519_PUBLIC_KEY_SIZE:]
+    
+    # Verify checksum
+    expected_checksum = AgentID._compute_checksum(public_key)
+    if not hmac.compare_digest(checksum, expected_checksum):
+        raise InvalidAgentID("AgentID checksum verification failed")
+    
+    return public_key
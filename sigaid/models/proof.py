@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 from typing import Any, TYPE_CHECKING
 
 from sigaid.constants import DOMAIN_VERIFY
+from sigaid.crypto.hashing import ZERO_HASH
 
 if TYPE_CHECKING:
     from sigaid.models.state import StateEntry
@@ -87,7 +88,7 @@ class ProofBundle:
         parts = [
             self.agent_id.encode("utf-8"),
             self.lease_token.encode("utf-8"),
-            self.state_head.entry_hash if self.state_head else bytes(32),
+            self.state_head.entry_hash if self.state_head else ZERO_HASH,
             self.challenge,
             self.challenge_response,
             self.timestamp.isoformat().encode("utf-8"),
@@ -135,7 +136,7 @@ class ProofBundleBuilder:
         signable = (
             self.agent_id.encode("utf-8") +
             self.lease_token.encode("utf-8") +
-            (self.state_head.entry_hash if self.state_head else bytes(32)) +
+            (self.state_head.entry_hash if self.state_head else ZERO_HASH) +
             challenge +
             challenge_response +
             timestamp.isoformat().encode("utf-8")
@@ -32,7 +32,30 @@ class ActionType(str, Enum):
     ERROR = "error"                  # Error occurred
 
 
-@dataclass(frozen=True)
+# Value -> member map; members hash like their str value, so they hit too
+_ACTION_TYPES: dict[str, ActionType] = {member.value: member for member in ActionType}
+
+
+def coerce_action_type(value: ActionType | str) -> ActionType:
+    """
+    Convert a string to ActionType without going through the Enum constructor.
+    
+    Args:
+        value: ActionType member or its string value
+        
+    Returns:
+        Matching ActionType
+        
+    Raises:
+        ValueError: If value is not a known action type
+    """
+    action_type = _ACTION_TYPES.get(value)
+    if action_type is None:
+        return ActionType(value)
+    return action_type
+
+
+@dataclass(frozen=True, slots=True)
 class StateEntry:
     """
     Immutable state chain entry.
@@ -54,6 +77,8 @@ class StateEntry:
     action_data_hash: bytes
     signature: bytes
     entry_hash: bytes
+    # Memoized signable_bytes(); safe because the entry is frozen
+    _signable: bytes | None = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
         """Validate field sizes."""
@@ -70,17 +95,22 @@ class StateEntry:
         """
         Get bytes that are signed for this entry.
         
-        This is all fields except signature and entry_hash.
+        This is all fields except signature and entry_hash. The result is
+        computed once per entry and reused by later signature checks.
         """
-        return (
-            self.agent_id.encode("utf-8") +
-            struct.pack(">Q", self.sequence) +
-            self.prev_hash +
-            self.timestamp.isoformat().encode("utf-8") +
-            self.action_type.value.encode("utf-8") +
-            self.action_summary.encode("utf-8") +
-            self.action_data_hash
-        )
+        signable = self._signable
+        if signable is None:
+            signable = (
+                self.agent_id.encode("utf-8") +
+                struct.pack(">Q", self.sequence) +
+                self.prev_hash +
+                self.timestamp.isoformat().encode("utf-8") +
+                self.action_type.value.encode("utf-8") +
+                self.action_summary.encode("utf-8") +
+                self.action_data_hash
+            )
+            object.__setattr__(self, "_signable", signable)
+        return signable
     
     def verify_signature(self, public_key: bytes) -> bool:
         """
@@ -133,7 +163,7 @@ class StateEntry:
             sequence=data["sequence"],
             prev_hash=bytes.fromhex(data["prev_hash"]),
             timestamp=datetime.fromisoformat(data["timestamp"]),
-            action_type=ActionType(data["action_type"]),
+            action_type=coerce_action_type(data["action_type"]),
             action_summary=data["action_summary"],
             action_data_hash=bytes.fromhex(data["action_data_hash"]),
             signature=bytes.fromhex(data["signature"]),
@@ -9,8 +9,9 @@ import os
 import platform
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterator
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
+from sigaid.constants import DOMAIN_STATE
 from sigaid.crypto.hashing import ZERO_HASH, hash_bytes, verify_chain_integrity
 from sigaid.exceptions import (
     ForkDetected,
@@ -18,7 +19,7 @@ from sigaid.exceptions import (
     StateChainBroken,
     StateChainError,
 )
-from sigaid.models.state import ActionType, StateEntry, StateEntryBuilder
+from sigaid.models.state import ActionType, StateEntry, StateEntryBuilder, coerce_action_type
 
 if TYPE_CHECKING:
     from sigaid.crypto.keys import KeyPair
@@ -55,6 +56,9 @@ class StateChain:
             print("Chain is valid")
     """
     
+    # Appends are journaled; a full snapshot is rewritten after this many
+    JOURNAL_COMPACT_EVERY = 256
+    
     def __init__(
         self,
         agent_id: str,
@@ -82,6 +86,9 @@ class StateChain:
         self._startup_synced = False
 
         self._entries: list[StateEntry] = []
+        self._by_hash: dict[bytes, StateEntry] = {}
+        self._head: StateEntry | None = None
+        self._journal_length = 0
         self._builder = StateEntryBuilder(agent_id, keypair)
 
         # Load from persistence if available (with locking and WAL recovery)
@@ -103,7 +110,7 @@ class StateChain:
     @property
     def head(self) -> StateEntry | None:
         """Get the most recent state entry (chain head)."""
-        return self._entries[-1] if self._entries else None
+        return self._head
     
     @property
     def length(self) -> int:
@@ -113,7 +120,7 @@ class StateChain:
     @property
     def sequence(self) -> int:
         """Get current sequence number (next entry will have sequence + 1)."""
-        return self._entries[-1].sequence if self._entries else -1
+        return self._head.sequence if self._head else -1
     
     @property
     def is_empty(self) -> bool:
@@ -122,7 +129,7 @@ class StateChain:
     
     def append(
         self,
-        action_type: ActionType,
+        action_type: ActionType | str,
         action_summary: str,
         action_data: dict[str, Any] | None = None,
     ) -> StateEntry:
@@ -130,7 +137,7 @@ class StateChain:
         Append new entry to the state chain.
 
         Args:
-            action_type: Type of action
+            action_type: Type of action (ActionType or its string value)
             action_summary: Human-readable summary
             action_data: Optional structured data (will be hashed)
 
@@ -139,18 +146,55 @@ class StateChain:
         """
         entry = self._builder.build(
             prev_entry=self.head,
-            action_type=action_type,
+            action_type=coerce_action_type(action_type),
             action_summary=action_summary,
             action_data=action_data,
         )
 
-        self._entries.append(entry)
+        self._push(entry)
 
-        # Persist locally if configured (with WAL for crash safety)
+        # Persist locally if configured (journaled, with WAL snapshots)
         if self._persistence_path:
-            self._save_to_file_with_wal(self._persistence_path)
+            self._persist_appended(self._persistence_path, [entry])
 
         return entry
+
+    def extend(
+        self,
+        actions: Iterable[tuple[ActionType | str, str, dict[str, Any] | None]],
+    ) -> list[StateEntry]:
+        """
+        Append several entries at once.
+
+        All entries are built and signed before any is added, and they are
+        persisted together with a single journal write and fsync, so this is
+        much cheaper than calling append() in a loop on a persistent chain.
+
+        Args:
+            actions: (action_type, action_summary, action_data) tuples,
+                in chain order
+
+        Returns:
+            The new StateEntry objects, in order
+        """
+        entries: list[StateEntry] = []
+        prev_entry = self.head
+        for action_type, action_summary, action_data in actions:
+            prev_entry = self._builder.build(
+                prev_entry=prev_entry,
+                action_type=coerce_action_type(action_type),
+                action_summary=action_summary,
+                action_data=action_data,
+            )
+            entries.append(prev_entry)
+
+        for entry in entries:
+            self._push(entry)
+
+        if self._persistence_path and entries:
+            self._persist_appended(self._persistence_path, entries)
+
+        return entries
     
     async def append_and_sync(
         self,
@@ -180,8 +224,10 @@ class StateChain:
             try:
                 await self._authority.append_state(self._agent_id, entry)
             except Exception as e:
-                # Remove local entry on failure
-                self._entries.pop()
+                # Remove local entry on failure, including any journaled copy
+                self._pop()
+                if self._persistence_path:
+                    self._save_to_file_with_wal(self._persistence_path)
                 raise StateChainError(f"Failed to sync state entry: {e}") from e
         
         return entry
@@ -206,12 +252,16 @@ class StateChain:
         if not verify_chain_integrity(self._entries):
             return False
         
-        # Verify all signatures
-        public_key = self._keypair.public_key_bytes()
-        for entry in self._entries:
-            if not entry.verify_signature(public_key):
+        # Verify all signatures in one batch against the cached public key
+        results = self._keypair.verify_batch(
+            [entry.signature for entry in self._entries],
+            [entry.signable_bytes() for entry in self._entries],
+            domain=DOMAIN_STATE,
+        )
+        for entry, valid in zip(self._entries, results):
+            if not valid:
+                logger.warning(f"Invalid signature on state entry {entry.sequence}")
                 return False
-        
         return True
     
     def verify_against_remote(self, remote_head: StateEntry) -> bool:
@@ -274,6 +324,18 @@ class StateChain:
             return None
         return self._entries[sequence]
     
+    def get_entry_by_hash(self, entry_hash: bytes) -> StateEntry | None:
+        """
+        Get entry by its entry hash.
+        
+        Args:
+            entry_hash: 32-byte entry hash
+            
+        Returns:
+            StateEntry or None if not found
+        """
+        return self._by_hash.get(entry_hash)
+    
     def get_entries(
         self,
         start_sequence: int = 0,
@@ -304,6 +366,27 @@ class StateChain:
         """Get entry by index."""
         return self._entries[index]
     
+    # ========== Entry Storage ==========
+
+    def _push(self, entry: StateEntry) -> None:
+        """Add an entry to the chain, its hash index and the cached head."""
+        self._entries.append(entry)
+        self._by_hash[entry.entry_hash] = entry
+        self._head = entry
+
+    def _pop(self) -> StateEntry:
+        """Remove the newest entry from the chain, its hash index and the cached head."""
+        entry = self._entries.pop()
+        self._by_hash.pop(entry.entry_hash, None)
+        self._head = self._entries[-1] if self._entries else None
+        return entry
+
+    def _set_entries(self, entries: list[StateEntry]) -> None:
+        """Replace all entries and rebuild the hash index and cached head."""
+        self._entries = entries
+        self._by_hash = {entry.entry_hash: entry for entry in entries}
+        self._head = entries[-1] if entries else None
+
     # ========== File Locking ==========
 
     def _acquire_file_lock(self, path: Path, exclusive: bool = True) -> int:
@@ -348,6 +431,74 @@ class StateChain:
         finally:
             os.close(fd)
 
+    # ========== Append Journal ==========
+
+    def _persist_appended(self, path: Path, entries: list[StateEntry]) -> None:
+        """
+        Persist newly appended entries.
+
+        The entries are appended to a line-delimited JSON journal next to the
+        chain file, so each append writes only the new entries instead of the
+        whole chain. A full snapshot is written instead when no chain file
+        exists yet or the journal has grown to JOURNAL_COMPACT_EVERY entries.
+        """
+        if (
+            not path.exists()
+            or self._journal_length + len(entries) >= self.JOURNAL_COMPACT_EVERY
+        ):
+            self._save_to_file_with_wal(path)
+            return
+
+        lock_fd = self._acquire_file_lock(path, exclusive=True)
+
+        try:
+            with open(path.with_suffix(".journal"), "a") as f:
+                f.write("".join(json.dumps(entry.to_dict()) + "\n" for entry in entries))
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_length += len(entries)
+        finally:
+            self._release_file_lock(lock_fd)
+
+    def _replay_journal(self, journal_path: Path) -> None:
+        """Apply journaled entries that are newer than the loaded snapshot."""
+        if not journal_path.exists():
+            return
+
+        with open(journal_path) as f:
+            lines = f.read().splitlines()
+
+        for line in lines:
+            try:
+                entry = StateEntry.from_dict(json.loads(line))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                # Torn write from a crash; compact on the next append
+                logger.warning(f"Ignoring incomplete state journal record: {e}")
+                self._journal_length = self.JOURNAL_COMPACT_EVERY
+                return
+
+            if entry.sequence < len(self._entries):
+                # Already in the snapshot; a crash between the snapshot rename
+                # and journal removal leaves identical copies behind
+                if self._entries[entry.sequence].entry_hash != entry.entry_hash:
+                    raise StateChainError(
+                        f"State journal conflicts with snapshot at sequence {entry.sequence}"
+                    )
+                continue
+            if entry.sequence != len(self._entries):
+                raise StateChainError(
+                    f"State journal gap: expected sequence {len(self._entries)}, "
+                    f"got {entry.sequence}"
+                )
+            expected_prev = self._head.entry_hash if self._head else ZERO_HASH
+            if entry.prev_hash != expected_prev:
+                raise StateChainError(
+                    f"State journal record {entry.sequence} does not link to the previous entry"
+                )
+            self._push(entry)
+
+        self._journal_length = len(lines)
+
     # ========== Write-Ahead Logging ==========
 
     def _save_to_file_with_wal(self, path: Path) -> None:
@@ -361,7 +512,7 @@ class StateChain:
         4. Write to temp file
         5. Sync temp to disk
         6. Atomic rename temp -> final
-        7. Delete WAL
+        7. Delete WAL and append journal (the snapshot now holds every entry)
         8. Release lock
         """
         lock_fd = self._acquire_file_lock(path, exclusive=True)
@@ -402,9 +553,13 @@ class StateChain:
                 # Directory sync may fail on some systems, not critical
                 pass
 
-            # Step 7: Delete WAL
+            # Step 7: Delete WAL and journal
             if wal_path.exists():
                 wal_path.unlink()
+            journal_path = path.with_suffix(".journal")
+            if journal_path.exists():
+                journal_path.unlink()
+            self._journal_length = 0
 
         finally:
             self._release_file_lock(lock_fd)
@@ -436,7 +591,8 @@ class StateChain:
                     f"Chain file agent_id mismatch: {data.get('agent_id')} != {self._agent_id}"
                 )
 
-            self._entries = [StateEntry.from_dict(e) for e in data.get("entries", [])]
+            self._set_entries([StateEntry.from_dict(e) for e in data.get("entries", [])])
+            self._replay_journal(path.with_suffix(".journal"))
 
         finally:
             self._release_file_lock(lock_fd)
@@ -542,7 +698,7 @@ class StateChain:
                         f"prev_hash mismatch"
                     )
             
-            self._entries.append(entry)
+            self._push(entry)
         
         # Save locally
         if self._persistence_path:
@@ -25,16 +25,42 @@ Example:
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from typing import List, Optional, TYPE_CHECKING
 
-from sigaid.crypto.hashing import hash_bytes, hash_multiple
+from sigaid.crypto.hashing import ZERO_HASH, hash_bytes, hash_pair
 
 if TYPE_CHECKING:
     from sigaid.models.state import StateEntry
 
 
-@dataclass
+# Binary proof layout: header, then one (sibling, direction) step per level
+_PROOF_HEADER = struct.Struct(">I32sB")
+_PROOF_STEP = struct.Struct(">32s?")
+
+
+def _fold_proof(leaf_hash: bytes, proof: MerkleProof) -> bytes:
+    """Hash a leaf up through the proof's siblings and return the result."""
+    current_hash = leaf_hash
+
+    for sibling, is_right in zip(proof.siblings, proof.directions):
+        if is_right:
+            # Sibling is on right
+            current_hash = hash_pair(current_hash, sibling)
+        else:
+            # Sibling is on left
+            current_hash = hash_pair(sibling, current_hash)
+
+    return current_hash
+
+
+def _hash_level(level: List[bytes]) -> List[bytes]:
+    """Hash adjacent pairs of an even-length level into its parent level."""
+    return [hash_pair(left, right) for left, right in zip(level[0::2], level[1::2])]
+
+
+@dataclass(slots=True)
 class MerkleProof:
     """Proof of inclusion in a merkle tree.
 
@@ -48,51 +74,43 @@ class MerkleProof:
 
     def to_bytes(self) -> bytes:
         """Serialize proof to bytes."""
-        import struct
-
         # Format: [4-byte index][32-byte leaf][1-byte count][siblings + directions]
-        result = struct.pack(">I", self.leaf_index)
-        result += self.leaf_hash
+        count = len(self.siblings)
+        header_size = _PROOF_HEADER.size
+        step_size = _PROOF_STEP.size
 
-        result += struct.pack("B", len(self.siblings))
-        for sibling, direction in zip(self.siblings, self.directions):
-            result += sibling
-            result += struct.pack("?", direction)
+        result = bytearray(header_size + step_size * count)
+        _PROOF_HEADER.pack_into(result, 0, self.leaf_index, self.leaf_hash, count)
+        for i, (sibling, direction) in enumerate(zip(self.siblings, self.directions)):
+            _PROOF_STEP.pack_into(result, header_size + i * step_size, sibling, direction)
 
-        return result
+        return bytes(result)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> MerkleProof:
-        """Deserialize proof from bytes."""
-        import struct
-
-        offset = 0
-
-        # Read index
-        leaf_index = struct.unpack_from(">I", data, offset)[0]
-        offset += 4
-
-        # Read leaf hash
-        leaf_hash = data[offset:offset + 32]
-        offset += 32
-
-        # Read siblings
-        count = data[offset]
-        offset += 1
-
-        siblings = []
-        directions = []
-        for _ in range(count):
-            siblings.append(data[offset:offset + 32])
-            offset += 32
-            directions.append(struct.unpack_from("?", data, offset)[0])
-            offset += 1
+        """
+        Deserialize proof from bytes.
+        
+        Raises:
+            ValueError: If the data is not exactly one serialized proof
+        """
+        if len(data) < _PROOF_HEADER.size:
+            raise ValueError("Merkle proof is truncated")
+        leaf_index, leaf_hash, count = _PROOF_HEADER.unpack_from(data, 0)
+
+        start = _PROOF_HEADER.size
+        end = start + _PROOF_STEP.size * count
+        if len(data) != end:
+            raise ValueError(
+                f"Merkle proof length mismatch: expected {end} bytes, got {len(data)}"
+            )
+        steps = list(_PROOF_STEP.iter_unpack(memoryview(data)[start:end]))
 
         return cls(
             leaf_index=leaf_index,
             leaf_hash=leaf_hash,
-            siblings=siblings,
-            directions=directions,
+            siblings=[sibling for sibling, _ in steps],
+            directions=[direction for _, direction in steps],
         )
 
     def to_dict(self) -> dict:
@@ -174,17 +192,46 @@ class MerkleTree:
         current_level = padded_leaves
 
         while len(current_level) > 1:
-            next_level = []
-            for i in range(0, len(current_level), 2):
-                left = current_level[i]
-                right = current_level[i + 1]
-                parent = hash_multiple(left, right)
-                next_level.append(parent)
-            tree.append(next_level)
-            current_level = next_level
+            current_level = _hash_level(current_level)
+            tree.append(current_level)
 
         return tree
 
+    def append(self, leaf_hash: bytes) -> None:
+        """Add a leaf, rehashing only its path to the root.
+
+        The result is identical to rebuilding the tree with the extra leaf,
+        but costs O(log n) hashes instead of O(n). When the padded width is
+        full, the tree is doubled by attaching an all-padding right subtree.
+
+        Args:
+            leaf_hash: 32-byte hash of the new leaf
+        """
+        index = len(self._leaves)
+        self._leaves.append(leaf_hash)
+
+        if index == 0:
+            self._tree = [[leaf_hash]]
+            return
+
+        if index == len(self._tree[0]):
+            self._grow()
+
+        self._tree[0][index] = leaf_hash
+        for depth in range(1, len(self._tree)):
+            index //= 2
+            below = self._tree[depth - 1]
+            self._tree[depth][index] = hash_pair(below[2 * index], below[2 * index + 1])
+
+    def _grow(self) -> None:
+        """Double the padded width, filling the new half with padding."""
+        empty = self.EMPTY_HASH
+        for level in self._tree:
+            level.extend([empty] * len(level))
+            empty = hash_pair(empty, empty)
+        top = self._tree[-1]
+        self._tree.append([hash_pair(top[0], top[1])])
+
     @property
     def root(self) -> bytes:
         """Get the merkle root (32 bytes)."""
@@ -206,11 +253,32 @@ class MerkleTree:
             raise IndexError(f"Leaf index {index} out of range")
         return self._leaves[index]
 
-    def get_proof(self, leaf_index: int) -> MerkleProof:
+    def get_layer(self, depth: int) -> List[bytes]:
+        """Get the nodes ``depth`` levels below the root.
+
+        A verifier holding this layer can check short proofs from
+        get_proof(..., layer_depth=depth) with verify_proof_against_layer().
+
+        Args:
+            depth: 0 for [root], 1 for the root's children, and so on
+
+        Returns:
+            List of 2**depth node hashes
+
+        Raises:
+            ValueError: If depth is outside the tree
+        """
+        if depth < 0 or depth >= len(self._tree):
+            raise ValueError(f"Layer depth {depth} out of range")
+        return list(self._tree[-1 - depth])
+
+    def get_proof(self, leaf_index: int, layer_depth: int = 0) -> MerkleProof:
         """Generate inclusion proof for a leaf.
 
         Args:
             leaf_index: Index of the leaf to prove
+            layer_depth: Stop this many levels below the root, for verifiers
+                that hold get_layer(layer_depth); 0 gives a full proof
 
         Returns:
             MerkleProof that can verify inclusion
@@ -227,7 +295,7 @@ class MerkleTree:
         current_index = leaf_index
 
         # Walk up the tree collecting siblings
-        for level in range(len(self._tree) - 1):
+        for level in range(max(len(self._tree) - 1 - layer_depth, 0)):
             # Determine sibling index
             if current_index % 2 == 0:
                 # Current is left child, sibling is right
@@ -267,17 +335,34 @@ class MerkleTree:
         if leaf_hash != proof.leaf_hash:
             return False
 
-        current_hash = leaf_hash
+        return _fold_proof(leaf_hash, proof) == expected_root
 
-        for sibling, is_right in zip(proof.siblings, proof.directions):
-            if is_right:
-                # Sibling is on right
-                current_hash = hash_multiple(current_hash, sibling)
-            else:
-                # Sibling is on left
-                current_hash = hash_multiple(sibling, current_hash)
+    @staticmethod
+    def verify_proof_against_layer(
+        leaf_hash: bytes,
+        proof: MerkleProof,
+        layer: List[bytes],
+    ) -> bool:
+        """Verify a short proof against a trusted cached layer.
+
+        The proof is climbed only up to the layer, so each check saves one
+        hash per cached level compared with verify_proof().
 
-        return current_hash == expected_root
+        Args:
+            leaf_hash: Hash of the leaf being verified
+            proof: MerkleProof from get_proof(..., layer_depth=d)
+            layer: Trusted nodes from get_layer(d) of the same tree
+
+        Returns:
+            True if the proof leads to the matching node of the layer
+        """
+        if leaf_hash != proof.leaf_hash:
+            return False
+
+        node_index = proof.leaf_index >> len(proof.siblings)
+        if node_index >= len(layer):
+            return False
+        return _fold_proof(leaf_hash, proof) == layer[node_index]
 
     def verify_entry(self, entry: StateEntry, expected_root: Optional[bytes] = None) -> bool:
         """Verify a state entry is in the tree.
@@ -316,11 +401,7 @@ class MerkleChainCommitment:
         self._entries: List[StateEntry] = entries.copy() if entries else []
         self._tree: Optional[MerkleTree] = None
         if self._entries:
-            self._rebuild_tree()
-
-    def _rebuild_tree(self) -> None:
-        """Rebuild merkle tree from entries."""
-        self._tree = MerkleTree.from_entries(self._entries)
+            self._tree = MerkleTree.from_entries(self._entries)
 
     def append(self, entry: StateEntry) -> None:
         """Append a new entry.
@@ -336,14 +417,16 @@ class MerkleChainCommitment:
             if entry.sequence != last_entry.sequence + 1:
                 raise ValueError("Entry sequence must be prev + 1")
         else:
-            from sigaid.constants import GENESIS_PREV_HASH
-            if entry.prev_hash != GENESIS_PREV_HASH:
+            if entry.prev_hash != ZERO_HASH:
                 raise ValueError("First entry must have genesis prev_hash")
             if entry.sequence != 0:
                 raise ValueError("First entry must have sequence 0")
 
         self._entries.append(entry)
-        self._rebuild_tree()
+        if self._tree is None:
+            self._tree = MerkleTree([entry.entry_hash])
+        else:
+            self._tree.append(entry.entry_hash)
 
     @property
     def root(self) -> Optional[bytes]:
@@ -396,9 +479,11 @@ class MerkleChainCommitment:
             Dictionary with root, head hash, and length
         """
         import base64
+        root = self.root
+        head = self.head
         return {
-            "merkle_root": base64.b64encode(self.root).decode("ascii") if self.root else None,
-            "head_hash": base64.b64encode(self.head.entry_hash).decode("ascii") if self.head else None,
-            "head_sequence": self.head.sequence if self.head else None,
+            "merkle_root": base64.b64encode(root).decode("ascii") if root else None,
+            "head_hash": base64.b64encode(head.entry_hash).decode("ascii") if head else None,
+            "head_sequence": head.sequence if head else None,
             "length": self.length,
         }
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Sequence
 
 from sigaid.crypto.hashing import ZERO_HASH, hash_state_entry, verify_chain_integrity
-from sigaid.crypto.signing import verify_with_domain
+from sigaid.crypto.signing import load_public_key, verify_with_domain
 from sigaid.constants import DOMAIN_STATE
 from sigaid.exceptions import (
     ForkDetected,
@@ -70,6 +70,10 @@ def verify_chain(
     """
     Verify an entire state chain.
     
+    Hashes, linkage and sequences are checked first; the public key is
+    then parsed once and every signature is checked against it, rather
+    than re-parsing the key per entry as verify_entry() would.
+    
     Args:
         entries: Sequence of entries in order
         public_key: Agent's public key
@@ -86,13 +90,18 @@ def verify_chain(
         if first.prev_hash != ZERO_HASH:
             return False
     
-    # Verify each entry and linkage
-    for i, entry in enumerate(entries):
-        prev = entries[i - 1] if i > 0 else None
-        if not verify_entry(entry, public_key, prev):
-            return False
+    # Verify hashes and linkage
+    if not verify_chain_integrity(entries):
+        return False
     
-    return True
+    # Verify all signatures against one loaded key
+    key = load_public_key(public_key)
+    if key is None:
+        return False
+    return all(
+        verify_with_domain(key, entry.signature, entry.signable_bytes(), DOMAIN_STATE)
+        for entry in entries
+    )
 
 
 class StateVerifier:
@@ -141,7 +150,13 @@ class StateVerifier:
             InvalidStateEntry: If entry is invalid
         """
         # Verify the entry itself
-        if not claimed_head.verify_signature(public_key):
+        key = load_public_key(public_key)
+        if key is None or not verify_with_domain(
+            key,
+            claimed_head.signature,
+            claimed_head.signable_bytes(),
+            DOMAIN_STATE,
+        ):
             raise InvalidStateEntry("Invalid signature on state head")
         
         if not claimed_head.verify_hash():
@@ -158,8 +173,10 @@ class StateVerifier:
         # Check against known head
         known = self._known_heads.get(agent_id)
         
-        if known is None:
-            # First interaction - record this head
+        # First interaction or claimed is ahead - record the new head. This is
+        # the common case, so it is decided by one sequence compare first.
+        # (In a full implementation, we'd verify the chain extends properly)
+        if known is None or claimed_head.sequence > known[0]:
             self._known_heads[agent_id] = (claimed_head.sequence, claimed_head.entry_hash)
             return True
         
@@ -177,18 +194,12 @@ class StateVerifier:
             return True
         
         # Claimed is behind known - suspicious but not necessarily a fork
-        if claimed_head.sequence < known_seq:
-            # This could be legitimate (old cached state) or a fork
-            # We can't tell without fetching the full chain
-            # For now, reject as stale
-            raise InvalidStateEntry(
-                f"State head is behind known: {claimed_head.sequence} < {known_seq}"
-            )
-        
-        # Claimed is ahead - update known head
-        # (In a full implementation, we'd verify the chain extends properly)
-        self._known_heads[agent_id] = (claimed_head.sequence, claimed_head.entry_hash)
-        return True
+        # This could be legitimate (old cached state) or a fork
+        # We can't tell without fetching the full chain
+        # For now, reject as stale
+        raise InvalidStateEntry(
+            f"State head is behind known: {claimed_head.sequence} < {known_seq}"
+        )
     
     def get_known_head(self, agent_id: str) -> tuple[int, bytes] | None:
         """
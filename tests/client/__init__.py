@@ -0,0 +1 @@
+"""Client module tests."""
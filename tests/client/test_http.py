@@ -0,0 +1,53 @@
+"""Tests for client/http.py - HTTP transport for Authority calls."""
+
+import httpx
+import pytest
+
+from sigaid.client.authority import AuthorityClient
+from sigaid.client.http import HTTPClient
+from sigaid.exceptions import AgentNotFound
+
+
+def _authority_app(request: httpx.Request) -> httpx.Response:
+    """Minimal in-process stand-in for the Authority API."""
+    if request.url.path == "/v1/agents/aid_known":
+        return httpx.Response(200, json={
+            "agent_id": "aid_known",
+            "public_key": "00" * 32,
+            "status": "active",
+            "created_at": "2025-01-01T00:00:00+00:00",
+        })
+    return httpx.Response(404, json={"error": {"message": "Agent not found"}})
+
+
+class TestHTTPClientTransport:
+    """Tests for injecting an httpx transport."""
+    
+    async def test_requests_use_injected_transport(self):
+        """Requests should be dispatched in-process through the transport."""
+        seen = []
+        
+        def handler(request):
+            seen.append((request.method, request.url.path, request.headers["Authorization"]))
+            return httpx.Response(200, json={"ok": True})
+        
+        client = HTTPClient("http://authority.test", "key_123", transport=httpx.MockTransport(handler))
+        try:
+            assert await client.post("/v1/ping", {"n": 1}) == {"ok": True}
+        finally:
+            await client.close()
+        
+        assert seen == [("POST", "/v1/ping", "Bearer key_123")]
+    
+    async def test_authority_client_over_transport(self):
+        """AuthorityClient should pass its transport through to HTTPClient."""
+        authority = AuthorityClient("http://authority.test", transport=httpx.MockTransport(_authority_app))
+        
+        try:
+            info = await authority.get_agent("aid_known")
+            assert info.agent_id == "aid_known"
+            
+            with pytest.raises(AgentNotFound):
+                await authority.get_agent("aid_missing")
+        finally:
+            await authority.close()
@@ -2,30 +2,47 @@
 
 import pytest
 import asyncio
-from pathlib import Path
-import tempfile
 
 from sigaid.crypto.keys import KeyPair
 from sigaid.identity.agent_id import AgentID
+from sigaid.state.chain import StateChain
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def keypair():
-    """Generate a fresh keypair for testing."""
+    """Keypair shared across the test session (treat as read-only)."""
     return KeyPair.generate()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agent_id(keypair):
     """Get agent ID from keypair."""
     return keypair.to_agent_id()
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for file-based tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def fresh_keypair():
+    """Generate a fresh keypair for tests that need an unshared key."""
+    return KeyPair.generate()
+
+
+@pytest.fixture
+def populated_chain(request, keypair):
+    """State chain for the session keypair with "Action {i}" transaction entries.
+
+    Holds four entries unless a test overrides the count with
+    ``@pytest.mark.parametrize("populated_chain", [n], indirect=True)``.
+    """
+    chain = StateChain(str(keypair.to_agent_id()), keypair)
+    for i in range(getattr(request, "param", 4)):
+        chain.append("transaction", f"Action {i}")
+    return chain
+
+
+@pytest.fixture(scope="session")
+def temp_dir(tmp_path_factory):
+    """Temporary directory shared by file-based tests (use unique file names)."""
+    return tmp_path_factory.mktemp("sigaid")
 
 
 @pytest.fixture
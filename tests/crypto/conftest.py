@@ -0,0 +1,35 @@
+"""Fixtures shared by the crypto tests."""
+
+import pytest
+
+from sigaid.crypto.keys import KeyPair
+
+
+@pytest.fixture(scope="module")
+def kp_a():
+    """Deterministic keypair derived from a fixed seed."""
+    return KeyPair.from_seed(b"\x01" * 32)
+
+
+@pytest.fixture(scope="module")
+def kp_b():
+    """Second deterministic keypair, distinct from kp_a."""
+    return KeyPair.from_seed(b"\xff" * 32)
+
+
+@pytest.fixture(autouse=True)
+def fast_scrypt(monkeypatch):
+    """Use a low scrypt cost for keyfiles written during tests.
+
+    The cost parameters are stored in each keyfile, so loading still
+    follows the normal code path.
+    """
+    monkeypatch.setattr("sigaid.crypto.keys.SCRYPT_N", 2**10)
+
+
+@pytest.fixture
+def flip_byte():
+    """Return a helper that inverts the byte at ``index`` of ``data``."""
+    def _flip_byte(data: bytes, index: int) -> bytes:
+        return data[:index] + bytes([data[index] ^ 0xFF]) + data[index + 1:]
+    return _flip_byte
@@ -1,11 +1,17 @@
 """Tests for crypto/hashing.py - BLAKE3 hashing operations."""
 
+import dataclasses
+
+import blake3
 import pytest
 
 from sigaid.crypto.hashing import (
     hash_bytes,
     hash_hex,
     hash_multiple,
+    hash_pair,
+    hash_state_entry,
+    verify_chain_integrity,
     ZERO_HASH,
 )
 from sigaid.constants import BLAKE3_HASH_SIZE
@@ -34,6 +40,16 @@ class TestHashBytes:
         """Empty input should produce valid hash."""
         result = hash_bytes(b"")
         assert len(result) == BLAKE3_HASH_SIZE
+    
+    def test_large_input_matches_incremental(self):
+        """Multithreaded hashing of large inputs should not change the digest."""
+        data = bytes(range(256)) * (1 << 12)  # 1 MiB, the multithreading threshold
+        
+        hasher = blake3.blake3()
+        for i in range(0, len(data), 1 << 16):
+            hasher.update(data[i:i + (1 << 16)])
+        
+        assert hash_bytes(data) == hasher.digest()
 
 
 class TestHashHex:
@@ -71,6 +87,15 @@ class TestHashMultiple:
         hash1 = hash_multiple(b"ab", b"cd")
         hash2 = hash_multiple(b"abc", b"d")
         assert hash1 != hash2
+    
+    @pytest.mark.parametrize("left,right", [
+        (hash_bytes(b"left"), hash_bytes(b"right")),
+        (b"ab", b"cd"),
+        (hash_bytes(b"left"), b""),
+    ])
+    def test_hash_pair_matches_hash_multiple(self, left, right):
+        """hash_pair() should equal hash_multiple() for any lengths."""
+        assert hash_pair(left, right) == hash_multiple(left, right)
 
 
 class TestZeroHash:
@@ -83,3 +108,42 @@ class TestZeroHash:
     def test_all_zeros(self):
         """ZERO_HASH should be all zeros."""
         assert ZERO_HASH == bytes(BLAKE3_HASH_SIZE)
+
+
+class TestVerifyChainIntegrity:
+    """Tests for verify_chain_integrity function."""
+    
+    @pytest.fixture
+    def entries(self, populated_chain):
+        """Entries of the shared four-entry chain."""
+        return list(populated_chain)
+    
+    def test_valid_chain(self, entries):
+        """A well-formed chain and any contiguous segment should pass."""
+        assert verify_chain_integrity(entries)
+        assert verify_chain_integrity(entries[1:])
+        assert verify_chain_integrity([])
+    
+    def test_detects_broken_link(self, entries):
+        """Skipping an entry should break the prev_hash linkage."""
+        assert not verify_chain_integrity([entries[0], entries[2], entries[3]])
+    
+    def test_entry_hash_covers_fields_in_order(self, entries):
+        """Entry hashes should be BLAKE3 over the canonical fields and signature."""
+        entry = entries[1]
+        hasher = blake3.blake3()
+        hasher.update(entry.agent_id.encode("utf-8"))
+        hasher.update(entry.sequence.to_bytes(8, "big"))
+        hasher.update(entry.prev_hash)
+        hasher.update(entry.timestamp.isoformat().encode("utf-8"))
+        hasher.update(entry.action_type.value.encode("utf-8"))
+        hasher.update(entry.action_summary.encode("utf-8"))
+        hasher.update(entry.action_data_hash)
+        hasher.update(entry.signature)
+        
+        assert hash_state_entry(entry) == hasher.digest() == entry.entry_hash
+    
+    def test_detects_tampered_entry(self, entries):
+        """Changing an entry's content should invalidate its stored hash."""
+        entries[2] = dataclasses.replace(entries[2], action_summary="Tampered")
+        assert not verify_chain_integrity(entries)
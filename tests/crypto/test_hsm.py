@@ -0,0 +1,114 @@
+"""Tests for crypto/hsm - Software key provider."""
+
+import pytest
+
+from sigaid.crypto.hsm import (
+    SoftwareKeyProvider,
+    get_key_provider,
+    reset_key_provider,
+    set_key_provider,
+)
+from sigaid.crypto.signing import verify, verify_with_domain
+
+
+class TestSoftwareKeyProvider:
+    """Tests for SoftwareKeyProvider class."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create an empty software provider."""
+        return SoftwareKeyProvider()
+
+    def test_sign_and_verify(self, provider):
+        """sign() output should verify with the same key and domain."""
+        key_id = provider.generate_key()
+        signature = provider.sign(key_id, b"data", domain="test.domain")
+
+        assert provider.verify(key_id, signature, b"data", domain="test.domain")
+        assert not provider.verify(key_id, signature, b"data", domain="other.domain")
+
+    def test_domain_matches_signing_module(self, provider):
+        """Provider signatures should match the signing module's domain encoding."""
+        key_id = provider.generate_key()
+        public_key = provider.get_public_key(key_id)
+
+        signature = provider.sign(key_id, b"data", domain="test.domain")
+        assert verify_with_domain(public_key, signature, b"data", "test.domain")
+
+        # An empty domain means no separation for providers
+        signature = provider.sign(key_id, b"data")
+        assert verify(public_key, signature, b"data")
+        assert provider.verify_batch([public_key], [signature], [b"data"]) == [True]
+
+    def test_verify_batch(self, provider):
+        """verify_batch() should report each item independently."""
+        key_a = provider.generate_key()
+        key_b = provider.generate_key()
+        pub_a = provider.get_public_key(key_a)
+        pub_b = provider.get_public_key(key_b)
+
+        sig_a = provider.sign(key_a, b"message a", domain="test.domain")
+        sig_b = provider.sign(key_b, b"message b", domain="test.domain")
+
+        results = provider.verify_batch(
+            [pub_a, pub_b, pub_a, b"invalid_key"],  # Third is the wrong key
+            [sig_a, sig_b, sig_b, sig_a],
+            [b"message a", b"message b", b"message b", b"message a"],
+            domain="test.domain",
+        )
+
+        assert results == [True, True, False, False]
+        with pytest.raises(ValueError):
+            provider.verify_batch([pub_a], [], [b"message a"])
+
+    def test_verify_batch_empty(self, provider):
+        """verify_batch() on no items should return an empty list."""
+        assert provider.verify_batch([], [], []) == []
+
+    def test_get_public_key_cached_until_delete(self, provider):
+        """get_public_key() should be cached and dropped on delete_key()."""
+        key_id = provider.generate_key()
+
+        assert provider.get_public_key(key_id) is provider.get_public_key(key_id)
+
+        assert provider.delete_key(key_id)
+        with pytest.raises(KeyError):
+            provider.get_public_key(key_id)
+
+    def test_list_keys(self, provider):
+        """list_keys() should describe every stored key."""
+        key_ids = {provider.generate_key(label=f"key{i}") for i in range(3)}
+
+        infos = provider.list_keys()
+
+        assert {info.key_id for info in infos} == key_ids
+        for info in infos:
+            assert info.public_key == provider.get_public_key(info.key_id)
+            assert not info.hardware_backed
+
+
+class TestGlobalKeyProvider:
+    """Tests for the module-level key provider accessors."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        """Isolate the global provider for each test."""
+        reset_key_provider()
+        yield
+        reset_key_provider()
+
+    def test_default_is_software(self):
+        """get_key_provider() should default to a single SoftwareKeyProvider."""
+        provider = get_key_provider()
+
+        assert isinstance(provider, SoftwareKeyProvider)
+        assert get_key_provider() is provider
+
+    def test_set_and_reset(self):
+        """set_key_provider() should override until reset_key_provider()."""
+        custom = SoftwareKeyProvider()
+        set_key_provider(custom)
+        assert get_key_provider() is custom
+
+        reset_key_provider()
+        assert get_key_provider() is not custom
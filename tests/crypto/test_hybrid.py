@@ -0,0 +1,201 @@
+"""Tests for crypto/hybrid.py - Post-quantum hybrid signatures."""
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from sigaid.crypto.hybrid import (
+    HYBRID_PUBLIC_SIZE,
+    HYBRID_VERSION,
+    ED25519_PUBLIC_SIZE,
+    ED25519_SIGNATURE_SIZE,
+    HybridKeyPair,
+    HybridPublicKey,
+    HybridPublicKeyArray,
+    _check_liboqs_available,
+    _check_pqcrypto_available,
+    is_hybrid_signature,
+    verify_hybrid_signature,
+)
+from sigaid.crypto.signing import verify_with_domain
+
+PQ_AVAILABLE = _check_pqcrypto_available() or _check_liboqs_available()
+
+requires_pq = pytest.mark.skipif(not PQ_AVAILABLE, reason="No post-quantum library installed")
+
+
+@pytest.fixture(scope="module")
+def ed25519_hybrid_keypair():
+    """Hybrid keypair with a placeholder Dilithium half, usable without a PQ library."""
+    return HybridKeyPair(Ed25519PrivateKey.from_private_bytes(b"\x01" * 32), b"", b"")
+
+
+@pytest.fixture(scope="module")
+def hybrid_keypair():
+    """Hybrid keypair shared by the module (Dilithium keygen is slow)."""
+    return HybridKeyPair.generate()
+
+
+@pytest.fixture(scope="module")
+def hybrid_signed(hybrid_keypair):
+    """Signatures made once per module, keyed by case name."""
+    return {
+        "plain": (b"message", hybrid_keypair.sign(b"message")),
+        "domain": (b"message", hybrid_keypair.sign(b"message", domain="test.domain")),
+    }
+
+
+class TestHybridPublicKey:
+    """Tests for HybridPublicKey serialization."""
+    
+    def test_bytes_roundtrip(self):
+        """from_bytes() should restore both key halves."""
+        ed25519_pub = b"\x01" * ED25519_PUBLIC_SIZE
+        dilithium_pub = b"\x02" * (HYBRID_PUBLIC_SIZE - ED25519_PUBLIC_SIZE)
+        
+        original = HybridPublicKey(ed25519_pub, dilithium_pub)
+        restored = HybridPublicKey.from_bytes(original.to_bytes())
+        
+        assert restored == original
+        assert restored.ed25519_public == ed25519_pub
+        assert restored.dilithium_public == dilithium_pub
+    
+    def test_from_bytes_rejects_wrong_size(self):
+        """from_bytes() should reject buffers of the wrong length."""
+        with pytest.raises(ValueError):
+            HybridPublicKey.from_bytes(b"\x00" * (HYBRID_PUBLIC_SIZE - 1))
+
+
+class TestHybridPublicKeyArray:
+    """Tests for HybridPublicKeyArray storage."""
+    
+    def test_indexing_returns_stored_keys(self):
+        """Items should round-trip through the arenas in order."""
+        keys = [
+            HybridPublicKey(bytes([i]) * ED25519_PUBLIC_SIZE, bytes([i]) * (HYBRID_PUBLIC_SIZE - ED25519_PUBLIC_SIZE))
+            for i in range(3)
+        ]
+        
+        array = HybridPublicKeyArray(keys)
+        
+        assert len(array) == 3
+        assert [array[i] for i in range(3)] == keys
+        assert array[-1] == keys[-1]
+        assert array.ed25519_arena == b"".join(k.ed25519_public for k in keys)
+        with pytest.raises(IndexError):
+            array[3]
+
+
+class TestIsHybridSignature:
+    """Tests for is_hybrid_signature function."""
+    
+    def test_accepts_hybrid_signature(self):
+        """Versioned signatures longer than Ed25519 should be hybrid."""
+        signature = bytes([HYBRID_VERSION]) + b"\x00" * (ED25519_SIGNATURE_SIZE + 10)
+        assert is_hybrid_signature(signature)
+    
+    def test_rejects_ed25519_signature(self):
+        """Plain 64-byte Ed25519 signatures are not hybrid."""
+        signature = bytes([HYBRID_VERSION]) + b"\x00" * (ED25519_SIGNATURE_SIZE - 1)
+        assert not is_hybrid_signature(signature)
+    
+    def test_exact_minimum_length(self):
+        """A version byte plus exactly 64 bytes is the smallest hybrid length."""
+        assert is_hybrid_signature(bytes([HYBRID_VERSION]) + b"\x00" * ED25519_SIGNATURE_SIZE)
+        assert not is_hybrid_signature(bytes([HYBRID_VERSION + 1]) + b"\x00" * ED25519_SIGNATURE_SIZE)
+    
+    def test_rejects_empty(self):
+        """Empty input is not a hybrid signature."""
+        assert not is_hybrid_signature(b"")
+
+
+class TestHybridKeyPairEd25519Only:
+    """Tests for the Ed25519 half of HybridKeyPair (no PQ library needed)."""
+    
+    def test_sign_verify_with_domain(self, ed25519_hybrid_keypair):
+        """Ed25519-only signatures should verify under the same domain only."""
+        signature = ed25519_hybrid_keypair.sign_ed25519_only(b"message", domain="test.domain")
+        
+        assert len(signature) == ED25519_SIGNATURE_SIZE
+        assert ed25519_hybrid_keypair.verify_ed25519_only(signature, b"message", domain="test.domain")
+        assert not ed25519_hybrid_keypair.verify_ed25519_only(signature, b"message", domain="other.domain")
+        assert not ed25519_hybrid_keypair.verify_ed25519_only(signature, b"message")
+    
+    def test_matches_signing_module(self, ed25519_hybrid_keypair):
+        """Domain-separated signatures should verify with sigaid.crypto.signing."""
+        signature = ed25519_hybrid_keypair.sign_ed25519_only(b"message", domain="test.domain")
+        public_key = ed25519_hybrid_keypair.public_key.ed25519_public
+        
+        assert verify_with_domain(public_key, signature, b"message", "test.domain")
+    
+    def test_verify_accepts_hybrid_envelope(self, ed25519_hybrid_keypair):
+        """The Ed25519 part of a versioned hybrid signature should verify."""
+        signature = ed25519_hybrid_keypair.sign_ed25519_only(b"message")
+        envelope = bytes([HYBRID_VERSION]) + signature + b"\x00" * 16
+        
+        assert ed25519_hybrid_keypair.verify_ed25519_only(envelope, b"message")
+
+
+@requires_pq
+@pytest.mark.xdist_group("pq")
+class TestHybridKeyPairWithPQ:
+    """Tests for HybridKeyPair sign/verify (requires PQ library)."""
+    
+    def test_sign_verify_roundtrip(self, hybrid_keypair, hybrid_signed):
+        """Hybrid signatures should verify with the same keypair."""
+        message, signature = hybrid_signed["domain"]
+        
+        assert is_hybrid_signature(signature)
+        assert hybrid_keypair.verify(signature, message, domain="test.domain")
+        assert hybrid_keypair.verify_ed25519_only(signature, message, domain="test.domain")
+    
+    def test_verify_wrong_domain_fails(self, hybrid_keypair, hybrid_signed):
+        """Verification should fail under a different domain."""
+        message, signature = hybrid_signed["domain"]
+        assert not hybrid_keypair.verify(signature, message, domain="other.domain")
+    
+    @pytest.mark.parametrize(
+        "offset",
+        [0, 1, 10, ED25519_SIGNATURE_SIZE, ED25519_SIGNATURE_SIZE + 1, -1],
+        ids=["version", "ed25519-first", "ed25519-mid", "ed25519-last", "dilithium-first", "dilithium-last"],
+    )
+    def test_verify_tampered_signature_fails(self, hybrid_keypair, hybrid_signed, flip_byte, offset):
+        """Flipping any single byte of a hybrid signature should fail verification."""
+        message, signature = hybrid_signed["plain"]
+        
+        tampered = flip_byte(signature, offset % len(signature))
+        
+        assert not hybrid_keypair.verify(tampered, message)
+    
+    def test_from_ed25519_only(self):
+        """from_ed25519_only() should keep the existing Ed25519 key."""
+        ed25519_private = Ed25519PrivateKey.generate()
+        
+        keypair = HybridKeyPair.from_ed25519_only(ed25519_private)
+        signature = keypair.sign_ed25519_only(b"message")
+        
+        ed25519_private.public_key().verify(signature, b"message")
+    
+    def test_verify_wrong_key_fails(self, hybrid_signed):
+        """Verification should fail with a different keypair."""
+        message, signature = hybrid_signed["plain"]
+        other = HybridKeyPair.generate()
+        assert not other.verify(signature, message)
+
+
+@requires_pq
+@pytest.mark.xdist_group("pq")
+class TestVerifyHybridSignature:
+    """Tests for standalone verify_hybrid_signature (requires PQ library)."""
+    
+    @pytest.fixture
+    def signature(self, hybrid_signed):
+        """Module-wide signature over b"message"."""
+        return hybrid_signed["plain"][1]
+    
+    def test_verifies_with_public_key(self, hybrid_keypair, signature):
+        """Standalone verification should accept a valid signature."""
+        assert verify_hybrid_signature(hybrid_keypair.public_key, signature, b"message")
+    
+    def test_rejects_tampered_message(self, hybrid_keypair, signature):
+        """Standalone verification should reject a different message."""
+        assert not verify_hybrid_signature(hybrid_keypair.public_key, signature, b"tampered")
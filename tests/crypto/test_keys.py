@@ -3,7 +3,9 @@
 import pytest
 from pathlib import Path
 
-from sigaid.crypto.keys import KeyPair, verify_signature_with_public_key
+from sigaid.crypto.keys import KeyPair, verify_batch, verify_signature_with_public_key
+from sigaid.crypto.state_encryption import StateEncryptor
+from sigaid.crypto.signing import verify_with_domain
 from sigaid.constants import ED25519_PRIVATE_KEY_SIZE, ED25519_PUBLIC_KEY_SIZE, ED25519_SIGNATURE_SIZE
 from sigaid.exceptions import InvalidKey, CryptoError
 
@@ -14,8 +16,10 @@ class TestKeyPair:
     def test_generate_creates_valid_keypair(self):
         """generate() should create a valid keypair."""
         keypair = KeyPair.generate()
+        public_key = keypair.public_key_bytes()
         
-        assert len(keypair.public_key_bytes()) == ED25519_PUBLIC_KEY_SIZE
+        assert len(public_key) == ED25519_PUBLIC_KEY_SIZE
+        assert keypair.public_key_bytes() is public_key
         assert len(keypair.private_key_bytes()) == ED25519_PRIVATE_KEY_SIZE
     
     def test_generate_creates_unique_keypairs(self):
@@ -44,9 +48,9 @@ class TestKeyPair:
         with pytest.raises(InvalidKey):
             KeyPair.from_seed(b"x" * 64)
     
-    def test_from_private_bytes_roundtrip(self):
+    def test_from_private_bytes_roundtrip(self, kp_a):
         """from_private_bytes() should restore keypair."""
-        original = KeyPair.generate()
+        original = kp_a
         private_bytes = original.private_key_bytes()
         
         restored = KeyPair.from_private_bytes(private_bytes)
@@ -54,70 +58,80 @@ class TestKeyPair:
         assert restored.public_key_bytes() == original.public_key_bytes()
         assert restored.private_key_bytes() == original.private_key_bytes()
     
-    def test_sign_produces_valid_signature(self):
-        """sign() should produce a verifiable signature."""
-        keypair = KeyPair.generate()
-        message = b"Hello, World!"
-        
-        signature = keypair.sign(message)
+    def test_sign_produces_valid_signature(self, kp_a):
+        """sign() should produce verifiable signatures."""
+        messages = [f"message {i}".encode() for i in range(32)]
+        signatures = [kp_a.sign(message) for message in messages]
         
-        assert len(signature) == ED25519_SIGNATURE_SIZE
-        assert keypair.verify(signature, message)
+        assert all(len(signature) == ED25519_SIGNATURE_SIZE for signature in signatures)
+        assert kp_a.verify_batch(signatures, messages) == [True] * len(messages)
     
-    def test_sign_with_domain_produces_unique_signature(self):
+    def test_sign_with_domain_produces_unique_signature(self, kp_a):
         """sign_with_domain() should produce different signature than sign()."""
-        keypair = KeyPair.generate()
         message = b"Hello, World!"
         
-        sig_plain = keypair.sign(message)
-        sig_domain = keypair.sign_with_domain(message, "test.domain.v1")
+        sig_plain = kp_a.sign(message)
+        sig_domain = kp_a.sign_with_domain(message, "test.domain.v1")
         
         assert sig_plain != sig_domain
     
-    def test_verify_with_domain_requires_same_domain(self):
+    def test_verify_with_domain_requires_same_domain(self, kp_a):
         """verify_with_domain() should fail with wrong domain."""
-        keypair = KeyPair.generate()
         message = b"Hello, World!"
         
-        signature = keypair.sign_with_domain(message, "correct.domain")
+        signature = kp_a.sign_with_domain(message, "correct.domain")
         
-        assert keypair.verify_with_domain(signature, message, "correct.domain")
-        assert not keypair.verify_with_domain(signature, message, "wrong.domain")
+        assert kp_a.verify_with_domain(signature, message, "correct.domain")
+        assert not kp_a.verify_with_domain(signature, message, "wrong.domain")
     
-    def test_verify_rejects_tampered_message(self):
+    def test_verify_rejects_tampered_message(self, kp_a):
         """verify() should reject signatures for tampered messages."""
-        keypair = KeyPair.generate()
         message = b"Original message"
         
-        signature = keypair.sign(message)
+        signature = kp_a.sign(message)
         
-        assert keypair.verify(signature, message)
-        assert not keypair.verify(signature, b"Tampered message")
+        assert kp_a.verify(signature, message)
+        assert not kp_a.verify(signature, b"Tampered message")
     
-    def test_verify_rejects_wrong_keypair(self):
+    def test_verify_rejects_tampered_signature(self, kp_a, flip_byte):
+        """verify() should reject a signature with a flipped byte."""
+        message = b"Original message"
+        signature = kp_a.sign(message)
+        
+        assert not kp_a.verify(flip_byte(signature, 10), message)
+    
+    def test_verify_rejects_wrong_keypair(self, kp_a, kp_b):
         """verify() should reject signatures from different keypair."""
-        kp1 = KeyPair.generate()
-        kp2 = KeyPair.generate()
         message = b"Hello, World!"
         
-        signature = kp1.sign(message)
+        signature = kp_a.sign(message)
         
-        assert kp1.verify(signature, message)
-        assert not kp2.verify(signature, message)
+        assert kp_a.verify(signature, message)
+        assert not kp_b.verify(signature, message)
     
-    def test_to_agent_id_is_deterministic(self):
+    def test_to_agent_id_is_deterministic(self, kp_a):
         """to_agent_id() should always return same ID."""
-        keypair = KeyPair.generate()
-        
-        id1 = keypair.to_agent_id()
-        id2 = keypair.to_agent_id()
+        id1 = kp_a.to_agent_id()
+        id2 = kp_a.to_agent_id()
         
         assert str(id1) == str(id2)
+        assert id1 is id2
+    
+    def test_to_agent_id_embeds_public_key(self, kp_a):
+        """to_agent_id() should embed the keypair's public key."""
+        assert kp_a.to_agent_id().public_key == kp_a.public_key_bytes()
+    
+    def test_repr_is_safe(self, kp_a):
+        """repr() should identify the agent without exposing the private key."""
+        repr_str = repr(kp_a)
+        
+        assert str(kp_a.to_agent_id()) in repr_str
+        assert kp_a.private_key_bytes().hex() not in repr_str
     
     def test_encrypted_file_roundtrip(self, temp_dir):
         """Keypair should survive encryption/decryption cycle."""
         original = KeyPair.generate()
-        path = temp_dir / "test.key"
+        path = temp_dir / "roundtrip.key"
         password = "test_password_123"
         
         original.to_encrypted_file(path, password)
@@ -126,73 +140,157 @@ class TestKeyPair:
         assert restored.public_key_bytes() == original.public_key_bytes()
         assert restored.private_key_bytes() == original.private_key_bytes()
     
-    def test_encrypted_file_wrong_password_fails(self, temp_dir):
+    def test_encrypted_file_wrong_password_fails(self, kp_a, temp_dir):
         """Decryption with wrong password should fail."""
-        keypair = KeyPair.generate()
-        path = temp_dir / "test.key"
+        path = temp_dir / "wrong_password.key"
         
-        keypair.to_encrypted_file(path, "correct_password")
+        kp_a.to_encrypted_file(path, "correct_password")
         
         with pytest.raises(CryptoError):
             KeyPair.from_encrypted_file(path, "wrong_password")
     
-    def test_derive_session_key_is_deterministic(self):
+    def test_derive_session_key_is_deterministic(self, kp_a):
         """derive_session_key() should be deterministic."""
-        keypair = KeyPair.generate()
         session_id = b"session_12345"
         
-        key1 = keypair.derive_session_key(session_id)
-        key2 = keypair.derive_session_key(session_id)
+        key1 = kp_a.derive_session_key(session_id)
+        key2 = kp_a.derive_session_key(session_id)
         
         assert key1 == key2
         assert len(key1) == 32
     
-    def test_derive_session_key_varies_with_session(self):
+    def test_derive_session_key_varies_with_session(self, kp_a):
         """derive_session_key() should vary with session ID."""
-        keypair = KeyPair.generate()
-        
-        key1 = keypair.derive_session_key(b"session_1")
-        key2 = keypair.derive_session_key(b"session_2")
+        key1 = kp_a.derive_session_key(b"session_1")
+        key2 = kp_a.derive_session_key(b"session_2")
         
         assert key1 != key2
+    
+    def test_clear_derived_keys_drops_cache(self, fresh_keypair):
+        """clear_derived_keys() should drop cached keys, including state encryption keys."""
+        key = fresh_keypair.derive_session_key(b"session_1")
+        encryptor = StateEncryptor(fresh_keypair, salt=b"context")
+        assert fresh_keypair.derive_session_key(b"session_1") is key
+        
+        fresh_keypair.clear_derived_keys()
+        
+        rederived = fresh_keypair.derive_session_key(b"session_1")
+        assert rederived == key and rederived is not key
+        assert StateEncryptor(fresh_keypair, salt=b"context").decrypt(
+            encryptor.encrypt(b"secret")
+        ) == b"secret"
 
 
 class TestVerifySignatureWithPublicKey:
     """Tests for standalone signature verification."""
     
-    def test_verifies_valid_signature(self):
+    def test_verifies_valid_signature(self, kp_a):
         """Should verify valid signature."""
-        keypair = KeyPair.generate()
         message = b"Test message"
-        signature = keypair.sign(message)
+        signature = kp_a.sign(message)
         
         assert verify_signature_with_public_key(
-            keypair.public_key_bytes(),
+            kp_a.public_key_bytes(),
             signature,
             message,
         )
     
-    def test_rejects_wrong_public_key(self):
+    def test_rejects_wrong_public_key(self, kp_a, kp_b):
         """Should reject signature with wrong public key."""
-        kp1 = KeyPair.generate()
-        kp2 = KeyPair.generate()
         message = b"Test message"
-        signature = kp1.sign(message)
+        signature = kp_a.sign(message)
         
         assert not verify_signature_with_public_key(
-            kp2.public_key_bytes(),
+            kp_b.public_key_bytes(),
             signature,
             message,
         )
     
-    def test_rejects_invalid_public_key(self):
+    def test_rejects_invalid_public_key(self, kp_a):
         """Should reject invalid public key bytes."""
-        keypair = KeyPair.generate()
         message = b"Test message"
-        signature = keypair.sign(message)
+        signature = kp_a.sign(message)
         
         assert not verify_signature_with_public_key(
             b"invalid_key",
             signature,
             message,
         )
+    
+    def test_accepts_bytes_like_public_key(self, kp_a):
+        """Should accept bytearray and memoryview keys and reject non-bytes."""
+        message = b"Test message"
+        signature = kp_a.sign(message)
+        public_key = kp_a.public_key_bytes()
+        
+        assert verify_signature_with_public_key(bytearray(public_key), signature, message)
+        assert verify_signature_with_public_key(memoryview(public_key), signature, message)
+        assert verify_batch([bytearray(public_key)], [signature], [message]) == [True]
+        assert not verify_signature_with_public_key("not a key", signature, message)
+
+
+class TestVerifyWithDomain:
+    """Tests for domain-separated verification with raw key bytes."""
+    
+    def test_accepts_raw_public_key_bytes(self, kp_a, kp_b):
+        """verify_with_domain() should load and check raw key bytes."""
+        message = b"Test message"
+        signature = kp_a.sign_with_domain(message, "test.domain.v1")
+        
+        for _ in range(2):
+            assert verify_with_domain(kp_a.public_key_bytes(), signature, message, "test.domain.v1")
+        assert not verify_with_domain(kp_b.public_key_bytes(), signature, message, "test.domain.v1")
+        assert not verify_with_domain(b"invalid_key", signature, message, "test.domain.v1")
+
+
+class TestVerifyBatch:
+    """Tests for batch signature verification."""
+    
+    def test_keypair_verify_batch(self, keypair):
+        """KeyPair.verify_batch() should verify each signature."""
+        messages = [f"message {i}".encode() for i in range(8)]
+        signatures = [keypair.sign(m) for m in messages]
+        
+        assert keypair.verify_batch(signatures, messages) == [True] * 8
+        
+        signatures[3] = signatures[4]
+        results = keypair.verify_batch(signatures, messages)
+        assert results == [True, True, True, False, True, True, True, True]
+    
+    def test_keypair_verify_batch_with_domain(self, keypair):
+        """KeyPair.verify_batch() should honour domain separation."""
+        messages = [b"first", b"second"]
+        signatures = [keypair.sign_with_domain(m, "test.domain.v1") for m in messages]
+        
+        assert keypair.verify_batch(signatures, messages, domain="test.domain.v1") == [True, True]
+        assert keypair.verify_batch(signatures, messages, domain="other.domain") == [False, False]
+        assert keypair.verify_batch(signatures, messages) == [False, False]
+    
+    def test_verify_batch_mixed_keys(self, keypair, fresh_keypair):
+        """verify_batch() should check each signature against its own key."""
+        message = b"Test message"
+        sig_a = keypair.sign(message)
+        sig_b = fresh_keypair.sign(message)
+        pub_a = keypair.public_key_bytes()
+        pub_b = fresh_keypair.public_key_bytes()
+        
+        results = verify_batch(
+            [pub_a, pub_b, pub_a, b"invalid_key"],
+            [sig_a, sig_b, sig_b, sig_a],
+            [message] * 4,
+        )
+        
+        assert results == [True, True, False, False]
+    
+    def test_verify_batch_with_domain(self, keypair):
+        """verify_batch() should apply the domain prefix when one is given."""
+        signature = keypair.sign_with_domain(b"message", "test.domain.v1")
+        public_key = keypair.public_key_bytes()
+        
+        assert verify_batch([public_key], [signature], [b"message"], domain="test.domain.v1") == [True]
+        assert verify_batch([public_key], [signature], [b"message"]) == [False]
+    
+    def test_verify_batch_length_mismatch(self, keypair):
+        """verify_batch() should reject sequences of different lengths."""
+        with pytest.raises(ValueError):
+            verify_batch([keypair.public_key_bytes()], [], [b"message"])
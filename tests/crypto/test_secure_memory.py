@@ -0,0 +1,101 @@
+"""Tests for crypto/secure_memory.py - zeroing and protected buffers."""
+
+import gc
+import os
+import weakref
+
+import pytest
+
+from sigaid.crypto.secure_memory import SecureBytes, mlock, munlock, secure_zero
+
+try:
+    import resource
+    _soft_memlock = resource.getrlimit(resource.RLIMIT_MEMLOCK)[0]
+    _CAN_MLOCK = (
+        os.geteuid() == 0
+        or _soft_memlock == resource.RLIM_INFINITY
+        or _soft_memlock >= 4096
+    )
+except ImportError:  # Windows
+    _CAN_MLOCK = False
+
+requires_mlock = pytest.mark.skipif(not _CAN_MLOCK, reason="RLIMIT_MEMLOCK too low")
+
+
+class TestSecureZero:
+    """Tests for secure_zero function."""
+    
+    def test_zeros_bytearray(self):
+        """secure_zero() should overwrite a bytearray in place."""
+        data = bytearray(b"secret key material")
+        secure_zero(data)
+        assert data == bytearray(len(data))
+    
+    def test_zeros_memoryview(self):
+        """secure_zero() should overwrite the buffer behind a memoryview."""
+        data = bytearray(b"secret key material")
+        secure_zero(memoryview(data)[6:])
+        assert data[:6] == b"secret"
+        assert data[6:] == bytearray(len(data) - 6)
+    
+    def test_zeros_large_buffer(self):
+        """secure_zero() should handle buffers larger than a page."""
+        data = bytearray(b"\xaa" * 10_000)
+        secure_zero(data)
+        assert data == bytearray(len(data))
+    
+    def test_empty_buffer_is_noop(self):
+        """secure_zero() should accept an empty buffer."""
+        secure_zero(bytearray())
+    
+    def test_rejects_immutable_bytes(self):
+        """secure_zero() should refuse bytes, which cannot be wiped."""
+        with pytest.raises(TypeError):
+            secure_zero(b"secret")
+
+
+@requires_mlock
+class TestMlockMunlock:
+    """Tests for mlock/munlock where the process may lock memory."""
+    
+    def test_mlock_and_munlock(self):
+        """A small buffer should lock and unlock."""
+        data = bytearray(64)
+        assert mlock(data)
+        assert munlock(data)
+    
+    def test_empty_buffer_succeeds(self):
+        """Locking an empty buffer is a successful no-op."""
+        assert mlock(bytearray())
+        assert munlock(bytearray())
+    
+    def test_secure_bytes_reports_lock(self):
+        """SecureBytes should report that its buffer is locked."""
+        secure = SecureBytes(b"\x42" * 32)
+        assert secure.is_locked
+        secure.clear()
+        assert not secure.is_locked
+
+
+class TestSecureBytes:
+    """Tests for SecureBytes container."""
+    
+    def test_clear_zeros_data(self):
+        """clear() should wipe the backing buffer and mark it cleared."""
+        secure = SecureBytes(b"\x42" * 32, lock_memory=False)
+        backing = secure._data
+        secure.clear()
+        assert secure.is_cleared
+        assert backing == bytearray(32)
+        with pytest.raises(ValueError, match="cleared"):
+            secure.data
+    
+    def test_destructor_clears_data(self):
+        """Collecting a SecureBytes should wipe its buffer via __del__."""
+        secure = SecureBytes(b"\x42" * 32, lock_memory=False)
+        backing = secure._data
+        ref = weakref.ref(secure)
+        del secure
+        gc.collect()
+        assert ref() is None
+        assert backing == bytearray(32)
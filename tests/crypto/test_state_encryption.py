@@ -0,0 +1,119 @@
+"""Tests for crypto/state_encryption.py - encrypting state entry fields."""
+
+import pytest
+
+from sigaid.crypto.state_encryption import (
+    StateEncryptor,
+    StateEncryptionHelper,
+    create_encryptor,
+)
+from sigaid.exceptions import CryptoError
+
+
+@pytest.fixture(scope="module")
+def encryptor(keypair):
+    """Encryptor bound to the shared session keypair."""
+    return StateEncryptor(keypair)
+
+
+class TestStateEncryptor:
+    """Tests for StateEncryptor."""
+    
+    @pytest.mark.parametrize(
+        "plaintext",
+        [b"", b"sensitive action details", b"same data" * 2, b"\x00" * 1024],
+    )
+    def test_encrypt_decrypt_roundtrip(self, encryptor, plaintext):
+        """decrypt() should recover what encrypt() produced."""
+        assert encryptor.decrypt(encryptor.encrypt(plaintext)) == plaintext
+    
+    def test_same_plaintext_different_ciphertexts(self, encryptor):
+        """Each encryption should use a fresh nonce."""
+        assert encryptor.encrypt(b"same data") != encryptor.encrypt(b"same data")
+    
+    def test_encrypt_empty_data(self, encryptor):
+        """Empty plaintext should encrypt to empty bytes and back."""
+        assert encryptor.encrypt(b"") == b""
+        assert encryptor.decrypt(b"") == b""
+    
+    def test_decrypt_wrong_key_fails(self, encryptor, fresh_keypair):
+        """Data encrypted for one keypair should not decrypt with another."""
+        encrypted = encryptor.encrypt(b"secret")
+        with pytest.raises(CryptoError, match="Decryption failed"):
+            StateEncryptor(fresh_keypair).decrypt(encrypted)
+    
+    def test_decrypt_tampered_data_fails(self, encryptor, flip_byte):
+        """Modified ciphertext should fail authentication."""
+        encrypted = encryptor.encrypt(b"secret")
+        with pytest.raises(CryptoError, match="Decryption failed"):
+            encryptor.decrypt(flip_byte(encrypted, len(encrypted) - 1))
+    
+    def test_decrypt_too_short_fails(self, encryptor):
+        """Truncated input should be rejected before decryption."""
+        with pytest.raises(CryptoError, match="too short"):
+            encryptor.decrypt(b"\x01" + b"\x00" * 12)
+    
+    def test_decrypt_unsupported_version_fails(self, encryptor):
+        """Unknown version headers should be rejected."""
+        encrypted = encryptor.encrypt(b"secret")
+        with pytest.raises(CryptoError, match="Unsupported encryption version"):
+            encryptor.decrypt(b"\x02" + encrypted[1:])
+    
+    def test_encryptor_with_salt(self, keypair, encryptor):
+        """A salt should derive a different key than no salt."""
+        salted = StateEncryptor(keypair, salt=b"context")
+        with pytest.raises(CryptoError):
+            encryptor.decrypt(salted.encrypt(b"secret"))
+    
+    def test_encryptor_same_salt_same_key(self, keypair):
+        """The same keypair and salt should derive the same key."""
+        first = StateEncryptor(keypair, salt=b"context")
+        second = StateEncryptor(keypair, salt=b"context")
+        assert second.decrypt(first.encrypt(b"secret")) == b"secret"
+
+
+class TestStateEncryptionHelper:
+    """Tests for StateEncryptionHelper."""
+    
+    def test_shares_key_with_encryptor(self, keypair, encryptor):
+        """Helpers for the same keypair should reuse the encryptor's derived key."""
+        helper = create_encryptor(keypair)
+        assert encryptor.decrypt(helper.encrypt_summary_bytes(b"secret")) == b"secret"
+    
+    def test_encrypt_decrypt_summary(self, keypair):
+        """Summaries should roundtrip as strings."""
+        helper = create_encryptor(keypair)
+        encrypted = helper.encrypt_summary("Paid merchant_xyz")
+        assert helper.decrypt_summary(encrypted) == "Paid merchant_xyz"
+    
+    def test_encrypt_decrypt_summary_bytes(self, keypair):
+        """Byte summaries should roundtrip and interoperate with str summaries."""
+        helper = create_encryptor(keypair)
+        encrypted = helper.encrypt_summary_bytes("Paid merchant_xyz".encode())
+        assert helper.decrypt_summary_bytes(encrypted) == b"Paid merchant_xyz"
+        assert helper.decrypt_summary(encrypted) == "Paid merchant_xyz"
+    
+    def test_encrypt_unicode_summary(self, keypair):
+        """Non-ASCII summaries should roundtrip."""
+        helper = create_encryptor(keypair)
+        summary = "Réservé un vol pour 東京 ✈"
+        assert helper.decrypt_summary(helper.encrypt_summary(summary)) == summary
+    
+    def test_encrypt_decrypt_action_data(self, keypair):
+        """Action data dictionaries should roundtrip."""
+        helper = create_encryptor(keypair)
+        data = {"amount": 100, "currency": "USD", "to": "merchant_xyz", "ok": True}
+        assert helper.decrypt_action_data(helper.encrypt_action_data(data)) == data
+    
+    def test_encrypt_complex_action_data(self, keypair):
+        """Nested action data should roundtrip."""
+        helper = create_encryptor(keypair)
+        data = {"items": [{"sku": "a", "qty": 2}, {"sku": "b", "qty": 1}], "meta": {"note": None}}
+        assert helper.decrypt_action_data(helper.encrypt_action_data(data)) == data
+    
+    def test_is_encrypted(self, keypair):
+        """is_encrypted() should recognise the version header."""
+        helper = create_encryptor(keypair)
+        assert StateEncryptionHelper.is_encrypted(helper.encrypt_summary("x"))
+        assert not StateEncryptionHelper.is_encrypted(b"")
+        assert not StateEncryptionHelper.is_encrypted(b"plain")
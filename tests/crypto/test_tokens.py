@@ -1,8 +1,7 @@
 """Tests for PASETO token management."""
 
 import secrets
-from datetime import timedelta
-import time
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -45,24 +44,94 @@ class TestLeaseTokenManager:
         assert "exp" in payload
         assert "jti" in payload
 
-    def test_expired_token(self, manager):
+    def test_expired_token(self):
         """Test that expired token raises TokenExpired."""
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        manager = LeaseTokenManager(secrets.token_bytes(32), clock=lambda: now)
+
+        token = manager.create_token(
+            agent_id="aid_test",
+            session_id="session_123",
+            ttl=timedelta(seconds=1),
+        )
+
+        now += timedelta(seconds=2)  # Advance past expiration
+
+        with pytest.raises(TokenExpired):
+            manager.verify_token(token)
+
+    def test_reverify_uses_cache(self, manager):
+        """Test that a cached token returns an independent payload copy."""
         token = manager.create_token(
             agent_id="aid_test",
             session_id="session_123",
-            ttl=timedelta(milliseconds=1),  # Expires almost immediately
+            metadata={"role": "worker"},
         )
 
-        time.sleep(0.01)  # Wait for expiration
+        first = manager.verify_token(token)
+        first["meta"]["role"] = "admin"
+
+        second = manager.verify_token(token)
+        assert second["meta"]["role"] == "worker"
+        assert second["jti"] == first["jti"]
+
+    def test_cached_token_still_expires(self):
+        """Test that a previously verified token expires on schedule."""
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        manager = LeaseTokenManager(secrets.token_bytes(32), clock=lambda: now)
+
+        token = manager.create_token(
+            agent_id="aid_test",
+            session_id="session_123",
+            ttl=timedelta(seconds=1),
+        )
+        manager.verify_token(token)
+
+        now += timedelta(seconds=2)
 
         with pytest.raises(TokenExpired):
             manager.verify_token(token)
 
+    def test_verify_tokens_batch(self, manager):
+        """Test batch verification returns payloads and errors in order."""
+        token = manager.create_token(
+            agent_id="aid_test",
+            session_id="session_123",
+        )
+
+        results = manager.verify_tokens([token, "v4.local.invalid_token", token])
+
+        assert results[0]["agent_id"] == "aid_test"
+        assert isinstance(results[1], TokenInvalid)
+        assert results[2] == results[0]
+
     def test_invalid_token(self, manager):
         """Test that invalid token raises TokenInvalid."""
         with pytest.raises(TokenInvalid):
             manager.verify_token("v4.local.invalid_token")
 
+    def test_wrong_header_rejected(self, manager):
+        """Test that tokens with another version/purpose are rejected."""
+        token = manager.create_token(
+            agent_id="aid_test",
+            session_id="session_123",
+        )
+
+        with pytest.raises(TokenInvalid):
+            manager.verify_token("v4.public." + token[len("v4.local."):])
+
+    def test_non_str_token_rejected(self, manager):
+        """Test that bytes tokens raise TokenInvalid rather than TypeError."""
+        token = manager.create_token(
+            agent_id="aid_test",
+            session_id="session_123",
+        )
+
+        with pytest.raises(TokenInvalid):
+            manager.verify_token(token.encode("utf-8"))
+        with pytest.raises(TokenInvalid):
+            manager.verify_token(bytearray(token.encode("utf-8")))
+
     def test_wrong_key_fails(self):
         """Test that wrong key fails verification."""
         manager1 = LeaseTokenManager(secrets.token_bytes(32))
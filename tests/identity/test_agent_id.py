@@ -3,7 +3,6 @@
 import pytest
 
 from sigaid.identity.agent_id import AgentID
-from sigaid.crypto.keys import KeyPair
 from sigaid.constants import AGENT_ID_PREFIX
 from sigaid.exceptions import InvalidAgentID
 
@@ -32,13 +31,10 @@ class TestAgentID:
         
         assert str(id1) == str(id2)
     
-    def test_different_keys_different_ids(self):
+    def test_different_keys_different_ids(self, keypair, fresh_keypair):
         """Different keys should produce different AgentIDs."""
-        kp1 = KeyPair.generate()
-        kp2 = KeyPair.generate()
-        
-        id1 = AgentID.from_keypair(kp1)
-        id2 = AgentID.from_keypair(kp2)
+        id1 = AgentID.from_keypair(keypair)
+        id2 = AgentID.from_keypair(fresh_keypair)
         
         assert str(id1) != str(id2)
     
@@ -66,9 +62,8 @@ class TestAgentID:
         with pytest.raises(InvalidAgentID):
             AgentID("aid_0OIl")  # Contains invalid Base58 chars
     
-    def test_rejects_bad_checksum(self):
+    def test_rejects_bad_checksum(self, keypair):
         """Should reject IDs with invalid checksum."""
-        keypair = KeyPair.generate()
         valid_id = str(AgentID.from_keypair(keypair))
         
         # Corrupt last character (checksum)
@@ -94,11 +89,11 @@ class TestAgentID:
         assert AgentID.is_valid_format(str(agent_id))
         assert not AgentID.is_valid_format("invalid")
     
-    def test_equality(self, keypair):
+    def test_equality(self, keypair, fresh_keypair):
         """AgentIDs should support equality comparison."""
         id1 = AgentID.from_keypair(keypair)
         id2 = AgentID.from_keypair(keypair)
-        id3 = AgentID.from_keypair(KeyPair.generate())
+        id3 = AgentID.from_keypair(fresh_keypair)
         
         assert id1 == id2
         assert id1 != id3
@@ -1,12 +1,13 @@
 """Tests for state/chain.py - State chain operations."""
 
+import json
 import pytest
 from datetime import datetime, timezone
 
 from sigaid.state.chain import StateChain
 from sigaid.models.state import ActionType, StateEntry
-from sigaid.crypto.keys import KeyPair
 from sigaid.crypto.hashing import ZERO_HASH
+from sigaid.exceptions import StateChainError
 
 
 class TestStateChain:
@@ -39,6 +40,15 @@ class TestStateChain:
         assert entry.sequence == 0
         assert entry.prev_hash == ZERO_HASH  # First entry
     
+    def test_action_type_as_string(self, chain):
+        """append() should accept an action type's string value."""
+        entry = chain.append("transaction", "Paid merchant")
+        
+        assert entry.action_type is ActionType.TRANSACTION
+        
+        with pytest.raises(ValueError):
+            chain.append("not_an_action", "Unknown")
+    
     def test_append_increments_sequence(self, chain):
         """Each append should increment sequence."""
         chain.append(ActionType.TRANSACTION, "First")
@@ -74,6 +84,15 @@ class TestStateChain:
         assert chain.get_entry(10) is None
         assert chain.get_entry(-1) is None
     
+    def test_get_entry_by_hash(self, chain):
+        """get_entry_by_hash() should retrieve by entry hash."""
+        entries = [chain.append(ActionType.TRANSACTION, f"Entry {i}") for i in range(3)]
+        
+        for entry in entries:
+            assert chain.get_entry_by_hash(entry.entry_hash) == entry
+        
+        assert chain.get_entry_by_hash(b"\x00" * 32) is None
+    
     def test_get_entries_range(self, chain):
         """get_entries() should return range."""
         for i in range(10):
@@ -92,6 +111,21 @@ class TestStateChain:
         
         assert chain.verify()
     
+    def test_verify_rejects_foreign_signatures(self, keypair, fresh_keypair, tmp_path, caplog):
+        """verify() should fail and report the first entry with a bad signature."""
+        path = tmp_path / "chain.json"
+        agent_id = str(keypair.to_agent_id())
+        chain = StateChain(agent_id, keypair, persistence_path=path)
+        for i in range(3):
+            chain.append(ActionType.TRANSACTION, f"Entry {i}")
+        
+        # Load the same file under a different signing key
+        other = StateChain(agent_id, fresh_keypair, persistence_path=path)
+        
+        assert other.length == 3
+        assert not other.verify()
+        assert "Invalid signature on state entry 0" in caplog.text
+    
     def test_iteration(self, chain):
         """Chain should support iteration."""
         for i in range(5):
@@ -126,6 +160,130 @@ class TestStateChain:
         
         assert restored.length == 2
         assert restored.head.action_summary == "Entry 2"
+        assert restored.get_entry_by_hash(restored.head.entry_hash) == restored.head
+
+
+class TestStateChainJournal:
+    """Tests for append-only persistence of state chains."""
+    
+    @pytest.fixture
+    def path(self, tmp_path):
+        """Chain file path in a per-test directory."""
+        return tmp_path / "chain.json"
+    
+    @pytest.fixture
+    def persisted_chain(self, keypair, path):
+        """Empty chain for the session keypair, persisted to ``path``."""
+        return StateChain(str(keypair.to_agent_id()), keypair, persistence_path=path)
+    
+    @pytest.fixture
+    def reload(self, persisted_chain, keypair, path):
+        """Return a helper that loads a new chain instance from ``path``."""
+        def _reload() -> StateChain:
+            return StateChain(persisted_chain.agent_id, keypair, persistence_path=path)
+        return _reload
+    
+    def test_appends_go_to_journal(self, persisted_chain, path, reload):
+        """Appends after the first should be journaled, not rewritten."""
+        for i in range(3):
+            persisted_chain.append(ActionType.TRANSACTION, f"Entry {i}")
+        
+        journal = path.with_suffix(".journal")
+        assert len(journal.read_text().splitlines()) == 2
+        
+        restored = reload()
+        assert [e.entry_hash for e in restored] == [e.entry_hash for e in persisted_chain]
+        assert restored.verify()
+    
+    def test_extend_journals_in_one_write(self, persisted_chain, path, reload):
+        """extend() should append and journal a batch of entries together."""
+        persisted_chain.append(ActionType.TRANSACTION, "Entry 0")
+        
+        entries = persisted_chain.extend(
+            ("transaction", f"Entry {i}", {"i": i}) for i in range(1, 4)
+        )
+        
+        assert [e.sequence for e in entries] == [1, 2, 3]
+        assert persisted_chain.head is entries[-1]
+        assert persisted_chain.verify()
+        assert len(path.with_suffix(".journal").read_text().splitlines()) == 3
+        
+        restored = reload()
+        assert [e.entry_hash for e in restored] == [e.entry_hash for e in persisted_chain]
+    
+    def test_extend_rejects_batch_atomically(self, persisted_chain, path):
+        """A bad action in a batch should leave the chain unchanged."""
+        with pytest.raises(ValueError):
+            persisted_chain.extend([("transaction", "Ok", None), ("not_an_action", "Bad", None)])
+        
+        assert persisted_chain.is_empty
+        assert not path.exists()
+    
+    async def test_failed_sync_rollback_survives_reload(self, keypair, path, reload):
+        """A rolled-back entry should not reappear when the chain is reloaded."""
+        
+        class FlakyAuthority:
+            fail = False
+            
+            async def append_state(self, agent_id, entry):
+                if self.fail:
+                    raise ConnectionError("Authority unavailable")
+        
+        authority = FlakyAuthority()
+        chain = StateChain(
+            str(keypair.to_agent_id()), keypair, authority=authority, persistence_path=path
+        )
+        await chain.append_and_sync(ActionType.TRANSACTION, "Entry 0")
+        await chain.append_and_sync(ActionType.TRANSACTION, "Entry 1")
+        
+        authority.fail = True
+        with pytest.raises(StateChainError):
+            await chain.append_and_sync(ActionType.TRANSACTION, "Rolled back")
+        authority.fail = False
+        await chain.append_and_sync(ActionType.TRANSACTION, "Entry 2")
+        await chain.append_and_sync(ActionType.TRANSACTION, "Entry 3")
+        
+        restored = reload()
+        assert [e.action_summary for e in restored] == [
+            "Entry 0", "Entry 1", "Entry 2", "Entry 3"
+        ]
+        assert restored.verify()
+    
+    def test_unlinked_journal_record_rejected(self, persisted_chain, path, reload):
+        """Replay should reject journal records that do not extend the head."""
+        persisted_chain.append(ActionType.TRANSACTION, "Entry 0")
+        persisted_chain.append(ActionType.TRANSACTION, "Entry 1")
+        
+        journal = path.with_suffix(".journal")
+        record = json.loads(journal.read_text())
+        record["prev_hash"] = ZERO_HASH.hex()
+        journal.write_text(json.dumps(record) + "\n")
+        
+        with pytest.raises(StateChainError):
+            reload()
+    
+    def test_journal_compacts_into_snapshot(self, persisted_chain, path, reload):
+        """Reaching the compaction threshold should rewrite the snapshot."""
+        persisted_chain.JOURNAL_COMPACT_EVERY = 3
+        for i in range(4):
+            persisted_chain.append(ActionType.TRANSACTION, f"Entry {i}")
+        
+        assert not path.with_suffix(".journal").exists()
+        assert reload().length == 4
+    
+    def test_torn_journal_record_is_ignored(self, persisted_chain, path, reload):
+        """A partially written journal line should be dropped on load."""
+        persisted_chain.append(ActionType.TRANSACTION, "Entry 0")
+        persisted_chain.append(ActionType.TRANSACTION, "Entry 1")
+        with open(path.with_suffix(".journal"), "a") as f:
+            f.write('{"agent_id": "trunc')
+        
+        restored = reload()
+        assert restored.length == 2
+        
+        restored.append(ActionType.TRANSACTION, "Entry 2")
+        assert not path.with_suffix(".journal").exists()
+        assert reload().length == 3
 
 
 class TestStateEntrySignatures:
@@ -149,12 +307,24 @@ class TestStateEntrySignatures:
         
         assert entry.verify_hash()
     
-    def test_wrong_key_fails_signature(self, keypair):
+    def test_signable_bytes_memoized(self, keypair):
+        """signable_bytes() should be computed once and not affect equality."""
+        agent_id = str(keypair.to_agent_id())
+        chain = StateChain(agent_id, keypair)
+        
+        entry = chain.append(ActionType.TRANSACTION, "Test")
+        copy = StateEntry.from_dict(entry.to_dict())
+        
+        assert entry.signable_bytes() is entry.signable_bytes()
+        assert copy == entry
+        assert hash(copy) == hash(entry)
+        assert copy.signable_bytes() == entry.signable_bytes()
+    
+    def test_wrong_key_fails_signature(self, keypair, fresh_keypair):
         """Signature should fail with wrong key."""
         agent_id = str(keypair.to_agent_id())
         chain = StateChain(agent_id, keypair)
         
         entry = chain.append(ActionType.TRANSACTION, "Test")
-        wrong_keypair = KeyPair.generate()
         
-        assert not entry.verify_signature(wrong_keypair.public_key_bytes())
+        assert not entry.verify_signature(fresh_keypair.public_key_bytes())
@@ -0,0 +1,185 @@
+"""Tests for state/merkle.py - Merkle trees over state chain entries."""
+
+import pytest
+
+from sigaid.crypto.hashing import hash_bytes, hash_multiple
+from sigaid.state.merkle import MerkleChainCommitment, MerkleProof, MerkleTree
+
+
+def _leaves(count):
+    return [hash_bytes(f"leaf {i}".encode()) for i in range(count)]
+
+
+class TestMerkleTree:
+    """Tests for MerkleTree class."""
+    
+    def test_empty_tree_root(self):
+        """Empty tree should have the empty hash as root."""
+        assert MerkleTree([]).root == MerkleTree.EMPTY_HASH
+    
+    def test_single_leaf_root(self):
+        """A single leaf should be its own root."""
+        leaves = _leaves(1)
+        assert MerkleTree(leaves).root == leaves[0]
+    
+    def test_power_of_two_leaves(self):
+        """Root of four leaves should be H(H(a, b), H(c, d))."""
+        a, b, c, d = _leaves(4)
+        expected = hash_multiple(hash_multiple(a, b), hash_multiple(c, d))
+        
+        tree = MerkleTree([a, b, c, d])
+        
+        assert tree.root == expected
+        assert tree.height == 3
+    
+    def test_odd_leaves_padded(self):
+        """Odd leaf counts should be padded with the empty hash."""
+        a, b, c = _leaves(3)
+        empty = MerkleTree.EMPTY_HASH
+        expected = hash_multiple(hash_multiple(a, b), hash_multiple(c, empty))
+        
+        assert MerkleTree([a, b, c]).root == expected
+    
+    def test_verify_proof_valid(self):
+        """Every leaf's proof should verify against the root."""
+        leaves = _leaves(8)
+        tree = MerkleTree(leaves)
+        
+        for i, leaf in enumerate(leaves):
+            assert MerkleTree.verify_proof(leaf, tree.get_proof(i), tree.root)
+    
+    def test_verify_proof_wrong_leaf(self):
+        """A proof should not verify for a different leaf."""
+        leaves = _leaves(8)
+        tree = MerkleTree(leaves)
+        
+        assert not MerkleTree.verify_proof(leaves[1], tree.get_proof(0), tree.root)
+    
+    def test_verify_proof_wrong_root(self):
+        """A proof should not verify against another tree's root."""
+        tree = MerkleTree(_leaves(8))
+        other = MerkleTree(_leaves(7))
+        
+        assert not MerkleTree.verify_proof(tree.get_leaf(3), tree.get_proof(3), other.root)
+    
+    def test_verify_proof_against_layer(self):
+        """Short proofs should verify against a cached layer."""
+        leaves = _leaves(8)
+        tree = MerkleTree(leaves)
+        layer = tree.get_layer(2)
+        
+        assert len(layer) == 4
+        for i, leaf in enumerate(leaves):
+            proof = tree.get_proof(i, layer_depth=2)
+            assert len(proof.siblings) == 1
+            assert MerkleTree.verify_proof_against_layer(leaf, proof, layer)
+        
+        short = tree.get_proof(0, layer_depth=2)
+        assert not MerkleTree.verify_proof_against_layer(leaves[1], short, layer)
+        assert not MerkleTree.verify_proof(leaves[0], short, tree.root)
+    
+    def test_full_proof_against_root_layer(self):
+        """Depth 0 should reduce to ordinary proof verification."""
+        leaves = _leaves(5)
+        tree = MerkleTree(leaves)
+        
+        assert tree.get_layer(0) == [tree.root]
+        assert MerkleTree.verify_proof_against_layer(leaves[4], tree.get_proof(4), [tree.root])
+    
+    @pytest.mark.parametrize("count", [1, 2, 3, 4, 5, 8, 9, 17])
+    def test_append_matches_rebuild(self, count):
+        """Appending leaves one by one should equal building at once."""
+        leaves = _leaves(count)
+        tree = MerkleTree([])
+        for leaf in leaves:
+            tree.append(leaf)
+        
+        rebuilt = MerkleTree(leaves)
+        assert tree.root == rebuilt.root
+        assert tree.height == rebuilt.height
+        assert [tree.get_proof(i) for i in range(count)] == [
+            rebuilt.get_proof(i) for i in range(count)
+        ]
+    
+    def test_get_proof_out_of_range(self):
+        """get_proof() should reject indexes outside the leaves."""
+        tree = MerkleTree(_leaves(3))
+        
+        with pytest.raises(IndexError):
+            tree.get_proof(3)
+
+
+class TestMerkleProof:
+    """Tests for MerkleProof serialization."""
+    
+    @pytest.fixture
+    def proof(self):
+        """Proof for a leaf in a five-leaf tree."""
+        return MerkleTree(_leaves(5)).get_proof(2)
+    
+    def test_to_bytes_from_bytes_roundtrip(self, proof):
+        """Binary serialization should roundtrip."""
+        assert MerkleProof.from_bytes(proof.to_bytes()) == proof
+    
+    def test_to_bytes_layout(self, proof):
+        """Binary form should be index, leaf, count, then sibling/direction steps."""
+        data = proof.to_bytes()
+        
+        assert len(data) == 4 + 32 + 1 + 33 * len(proof.siblings)
+        assert data[:4] == (2).to_bytes(4, "big")
+        assert data[4:36] == proof.leaf_hash
+        assert data[36] == len(proof.siblings)
+        assert data[37:69] == proof.siblings[0]
+        assert data[69] == proof.directions[0]
+    
+    def test_from_bytes_rejects_truncated(self, proof):
+        """Deserialization should reject data shorter or longer than declared."""
+        data = proof.to_bytes()
+        
+        with pytest.raises(ValueError):
+            MerkleProof.from_bytes(data[:-33])  # Ends on a step boundary
+        with pytest.raises(ValueError):
+            MerkleProof.from_bytes(data[:20])
+        with pytest.raises(ValueError):
+            MerkleProof.from_bytes(data + b"\x00")
+    
+    def test_to_dict_from_dict_roundtrip(self, proof):
+        """Dictionary serialization should roundtrip."""
+        assert MerkleProof.from_dict(proof.to_dict()) == proof
+
+
+class TestMerkleChainCommitment:
+    """Tests for MerkleChainCommitment."""
+    
+    def test_empty_commitment(self):
+        """Empty commitment has no root or head."""
+        commitment = MerkleChainCommitment()
+        
+        assert commitment.root is None
+        assert commitment.to_commitment()["length"] == 0
+    
+    @pytest.mark.parametrize("populated_chain", [4, 6], indirect=True)
+    def test_append_chain(self, populated_chain):
+        """Appended entries should be provable against the running root."""
+        entries = list(populated_chain)
+        commitment = MerkleChainCommitment()
+        for i, entry in enumerate(entries):
+            commitment.append(entry)
+            
+            assert commitment.head == entry
+            assert commitment.root == MerkleTree.from_entries(entries[:i + 1]).root
+        
+        for entry in entries:
+            proof = commitment.get_proof(entry.sequence)
+            assert commitment.verify_proof(entry.entry_hash, proof)
+    
+    def test_append_rejects_broken_link(self, populated_chain):
+        """Entries that do not extend the head should be rejected."""
+        first = populated_chain[0]
+        
+        commitment = MerkleChainCommitment()
+        with pytest.raises(ValueError):
+            commitment.append(populated_chain.head)
+        commitment.append(first)
+        with pytest.raises(ValueError):
+            commitment.append(first)
@@ -0,0 +1,90 @@
+"""Tests for state/verification.py - State head verification."""
+
+import pytest
+
+from sigaid.exceptions import ForkDetected, InvalidStateEntry
+from sigaid.state.chain import StateChain
+from sigaid.state.verification import StateVerifier, verify_chain
+
+
+class TestStateVerifier:
+    """Tests for StateVerifier class."""
+    
+    @pytest.fixture
+    def chain(self, populated_chain):
+        """The shared four-entry chain."""
+        return populated_chain
+    
+    def test_verify_head_records_and_advances(self, chain, keypair):
+        """verify_head() should accept a valid head and later extensions."""
+        verifier = StateVerifier()
+        public_key = keypair.public_key_bytes()
+        
+        assert verifier.verify_head(chain.agent_id, chain.get_entry(1), public_key)
+        assert verifier.verify_head(chain.agent_id, chain.head, public_key)
+        assert verifier.get_known_head(chain.agent_id) == (chain.sequence, chain.head.entry_hash)
+    
+    def test_verify_head_wrong_key(self, chain, fresh_keypair):
+        """verify_head() should reject a head signed by another key."""
+        verifier = StateVerifier()
+        
+        with pytest.raises(InvalidStateEntry):
+            verifier.verify_head(chain.agent_id, chain.head, fresh_keypair.public_key_bytes())
+        with pytest.raises(InvalidStateEntry):
+            verifier.verify_head(chain.agent_id, chain.head, b"invalid_key")
+    
+    def test_verify_head_after_key_change(self, chain, keypair, fresh_keypair):
+        """A cached key should not be reused for different key bytes."""
+        verifier = StateVerifier()
+        verifier.verify_head(chain.agent_id, chain.head, keypair.public_key_bytes())
+        
+        with pytest.raises(InvalidStateEntry):
+            verifier.verify_head(chain.agent_id, chain.head, fresh_keypair.public_key_bytes())
+        assert verifier.verify_head(chain.agent_id, chain.head, keypair.public_key_bytes())
+    
+    def test_verify_head_detects_fork(self, chain, keypair):
+        """A different head at a known sequence should raise ForkDetected."""
+        verifier = StateVerifier()
+        public_key = keypair.public_key_bytes()
+        verifier.verify_head(chain.agent_id, chain.head, public_key)
+        
+        other = StateChain(chain.agent_id, keypair)
+        for i in range(chain.length):
+            other.append("transaction", f"Other {i}")
+        
+        with pytest.raises(ForkDetected):
+            verifier.verify_head(chain.agent_id, other.head, public_key)
+    
+    def test_verify_head_rejects_stale(self, chain, keypair):
+        """A head behind the known one should be rejected as stale."""
+        verifier = StateVerifier()
+        public_key = keypair.public_key_bytes()
+        verifier.verify_head(chain.agent_id, chain.head, public_key)
+        
+        with pytest.raises(InvalidStateEntry):
+            verifier.verify_head(chain.agent_id, chain.get_entry(0), public_key)
+        assert verifier.verify_head(chain.agent_id, chain.head, public_key)
+
+
+class TestVerifyChain:
+    """Tests for verify_chain function."""
+    
+    @pytest.fixture
+    def entries(self, populated_chain):
+        """Entries of the shared four-entry chain."""
+        return list(populated_chain)
+    
+    def test_valid_chain(self, entries, keypair):
+        """A well-formed chain should verify."""
+        assert verify_chain(entries, keypair.public_key_bytes())
+        assert verify_chain(entries[2:], keypair.public_key_bytes())
+        assert verify_chain([], keypair.public_key_bytes())
+    
+    def test_wrong_key(self, entries, fresh_keypair):
+        """Signatures should be checked against the given key."""
+        assert not verify_chain(entries, fresh_keypair.public_key_bytes())
+        assert not verify_chain(entries, b"invalid_key")
+    
+    def test_broken_link(self, entries, keypair):
+        """Entries that do not link should fail verification."""
+        assert not verify_chain([entries[0], entries[2]], keypair.public_key_bytes())